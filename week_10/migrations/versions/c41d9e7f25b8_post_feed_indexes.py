@@ -0,0 +1,40 @@
+"""post feed composite indexes
+
+Revision ID: c41d9e7f25b8
+Revises: a323b83616f9
+Create Date: 2026-08-29 12:02:11.418306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41d9e7f25b8'
+down_revision = 'a323b83616f9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('post', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_post_feed',
+            ['is_deleted', 'status', sa.text('created_at DESC')],
+            unique=False,
+        )
+        batch_op.create_index(
+            'ix_post_scheduled', ['is_deleted', 'scheduled_for'], unique=False
+        )
+        batch_op.drop_index(batch_op.f('ix_post_status'))
+        batch_op.drop_index(batch_op.f('ix_post_scheduled_for'))
+        batch_op.drop_index(batch_op.f('ix_post_created_at'))
+
+
+def downgrade():
+    with op.batch_alter_table('post', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_post_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_post_scheduled_for'), ['scheduled_for'], unique=False)
+        batch_op.create_index(batch_op.f('ix_post_status'), ['status'], unique=False)
+        batch_op.drop_index('ix_post_scheduled')
+        batch_op.drop_index('ix_post_feed')
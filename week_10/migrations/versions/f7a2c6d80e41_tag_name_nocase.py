@@ -0,0 +1,36 @@
+"""tag name NOCASE collation
+
+Revision ID: f7a2c6d80e41
+Revises: c41d9e7f25b8
+Create Date: 2026-08-29 12:31:54.807215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7a2c6d80e41'
+down_revision = 'c41d9e7f25b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tag', schema=None) as batch_op:
+        batch_op.alter_column(
+            'name',
+            existing_type=sa.String(length=50),
+            type_=sa.String(length=50, collation='NOCASE'),
+            existing_nullable=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('tag', schema=None) as batch_op:
+        batch_op.alter_column(
+            'name',
+            existing_type=sa.String(length=50, collation='NOCASE'),
+            type_=sa.String(length=50),
+            existing_nullable=False,
+        )
@@ -0,0 +1,12 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+# Point the app at a throwaway database before it is imported.
+os.environ["BLOG_DATABASE_PATH"] = os.path.join(
+    tempfile.mkdtemp(prefix="blog-test-"), "blog.db"
+)
@@ -0,0 +1,40 @@
+import pytest
+
+from app import app, cache, db, init_fts, Post
+
+# The feed must stay at a constant number of queries no matter how many
+# posts exist: one paginated SELECT, one COUNT, one tags IN-load, plus
+# session bookkeeping.
+MAX_FEED_QUERIES = 8
+
+
+@pytest.fixture
+def client():
+    app.config["DEBUG"] = True
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        init_fts()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+        cache.clear()
+
+
+def _seed_posts(n):
+    for i in range(n):
+        db.session.add(Post(title=f"post {i}", content="body"))
+    db.session.commit()
+
+
+def test_feed_query_count_is_constant(client):
+    _seed_posts(3)
+    cache.clear()
+    small = int(client.get("/").headers["X-SQL-Count"])
+
+    _seed_posts(50)
+    cache.clear()
+    large = int(client.get("/").headers["X-SQL-Count"])
+
+    assert small <= MAX_FEED_QUERIES
+    assert large <= MAX_FEED_QUERIES
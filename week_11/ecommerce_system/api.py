@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import List, Optional
+from operator import attrgetter
+from pathlib import Path
+from typing import Annotated, Optional
 
+import msgspec
+import orjson
 from fastapi import (
     Depends,
     FastAPI,
@@ -15,25 +20,72 @@ from fastapi import (
     Response,
     status,
 )
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
+from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from .platform import ECommercePlatform, bootstrap_platform
 from .storage import PlatformStorage
 from .users import AuthenticationError, User, require_admin
-from .models import Order, Product, Category
-from .payments import PaymentError, PaymentReceipt
+from .payments import PaymentError
+
+
+def _orjson_default(obj):
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(Response):
+    """Default JSON response: orjson is several times faster than stdlib json
+    and handles datetime/UUID natively; Decimal is stringified via default."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
 
 
 storage = PlatformStorage()
 platform: ECommercePlatform = bootstrap_platform(storage=storage)
-app = FastAPI(title="Advanced E-Commerce Platform")
-templates = Jinja2Templates(directory="ecommerce_system/templates")
+app = FastAPI(
+    title="Advanced E-Commerce Platform", default_response_class=ORJSONResponse
+)
+
+# Templates are compiled once at import time; rendering a pre-compiled
+# Template skips the per-request environment/resolver work that
+# Jinja2Templates.TemplateResponse does.
+_env = Environment(
+    loader=FileSystemLoader(Path(__file__).resolve().parent / "templates"),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=-1,
+)
+STORE_TPL = _env.get_template("store.html")
+LOGIN_TPL = _env.get_template("login.html")
+CART_TPL = _env.get_template("cart.html")
+CHECKOUT_RESULT_TPL = _env.get_template("checkout_result.html")
+ADMIN_TPL = _env.get_template("admin.html")
+ORDERS_TPL = _env.get_template("orders.html")
+
+# Baseline context shared by every UI render; Template.render(dict, **kwargs)
+# merges the kwargs over it, so handlers only spell out what differs.
+_BASE_CTX = {"current_user": None, "message": None}
+
+
+# One precompiled accessor instead of four attribute lookups per cart item;
+# zip against the static key tuple builds each response dict in a single pass.
+_CART_KEYS = ("product_id", "name", "quantity", "line_total")
+_cart_fields = attrgetter("product.id", "product.name", "quantity", "line_total")
+
+
+def _cart_item_dicts(cart):
+    return [dict(zip(_CART_KEYS, _cart_fields(item))) for item in cart.items()]
 
 
 def _extract_token(authorization: str = Header(...)) -> str:
-    if authorization.lower().startswith("bearer "):
+    # Case-insensitive compare on just the 7-char prefix; the slice is safe
+    # for short headers and never copies the (possibly long) token itself.
+    if authorization[:7].casefold() == "bearer ":
         return authorization[7:]
     return authorization
 
@@ -50,48 +102,77 @@ def get_admin_user(user: User = Depends(get_current_user)) -> User:
     return user
 
 
-class LoginRequest(BaseModel):
+class MsgspecJSONResponse(Response):
+    """JSON response rendered with msgspec, which natively handles the domain
+    dataclasses (Decimal, datetime, enums) without a Pydantic round-trip."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return msgspec.json.encode(content)
+
+
+def msgspec_body(struct_type):
+    """Dependency that decodes+validates the request body as a msgspec Struct,
+    bypassing Pydantic's per-field validation machinery."""
+
+    decoder = msgspec.json.Decoder(struct_type)
+
+    async def dependency(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as exc:
+            # DecodeError covers both malformed JSON and its ValidationError
+            # subclass for type mismatches — either way it's a client error.
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+            )
+
+    return dependency
+
+
+class LoginRequest(msgspec.Struct):
     username: str
     password: str
 
 
-class LoginResponse(BaseModel):
+class LoginResponse(msgspec.Struct):
     token: str
 
 
-class CategoryCreateRequest(BaseModel):
+class CategoryCreateRequest(msgspec.Struct):
     name: str
     description: str = ""
 
 
-class ProductCreateRequest(BaseModel):
+class ProductCreateRequest(msgspec.Struct):
     name: str
     price: Decimal
-    stock: int = Field(gt=0)
+    stock: Annotated[int, msgspec.Meta(gt=0)]
     category_id: str
     description: str = ""
 
 
-class CartItemRequest(BaseModel):
+class CartItemRequest(msgspec.Struct):
     product_id: str
-    quantity: int = Field(gt=0)
+    quantity: Annotated[int, msgspec.Meta(gt=0)]
 
 
-class CheckoutRequest(BaseModel):
+class CheckoutRequest(msgspec.Struct):
     payment_method: str
 
 
-class PaymentConfirmationRequest(BaseModel):
+class PaymentConfirmationRequest(msgspec.Struct):
     otp: Optional[str] = None
     transaction_id: Optional[str] = None
     delivered: Optional[bool] = None
 
 
-@app.post("/auth/login", response_model=LoginResponse)
-def login(body: LoginRequest) -> LoginResponse:
+@app.post("/auth/login", response_class=MsgspecJSONResponse)
+def login(body: LoginRequest = Depends(msgspec_body(LoginRequest))):
     try:
         token = platform.auth_service.login(body.username, body.password)
-        return LoginResponse(token=token)
+        return MsgspecJSONResponse(LoginResponse(token=token))
     except AuthenticationError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc))
 
@@ -114,14 +195,25 @@ def confirm_password_reset(token: str, new_password: str):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
-@app.get("/catalog/categories", response_model=List[Category])
-def list_categories() -> List[Category]:
-    return list(platform.categories.values())
+# The listing/read endpoints below return trusted in-memory domain objects;
+# re-validating them through a response_model would be pure overhead, so they
+# are encoded directly with msgspec. They are `async def` because they never
+# block: plain `def` handlers get dispatched through the shared 40-thread
+# anyio pool, which these hot reads would otherwise consume for no benefit.
+# Mutating handlers stay sync — they persist JSON to disk via PlatformStorage.
+
 
+@app.get("/catalog/categories", response_class=MsgspecJSONResponse)
+async def list_categories():
+    return MsgspecJSONResponse(platform.categories_list())
 
-@app.post("/catalog/categories", response_model=Category)
-def create_category(body: CategoryCreateRequest, admin: User = Depends(get_admin_user)) -> Category:
-    return platform.create_category(body.name, body.description, admin)
+
+@app.post("/catalog/categories", response_class=MsgspecJSONResponse)
+def create_category(
+    body: CategoryCreateRequest = Depends(msgspec_body(CategoryCreateRequest)),
+    admin: User = Depends(get_admin_user),
+):
+    return MsgspecJSONResponse(platform.create_category(body.name, body.description, admin))
 
 
 @app.delete("/catalog/categories/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -129,20 +221,25 @@ def delete_category(category_id: str, admin: User = Depends(get_admin_user)) ->
     platform.delete_category(category_id, admin)
 
 
-@app.get("/catalog/products", response_model=List[Product])
-def list_products() -> List[Product]:
-    return list(platform.products.values())
+@app.get("/catalog/products", response_class=MsgspecJSONResponse)
+async def list_products():
+    return MsgspecJSONResponse(platform.products_list())
 
 
-@app.post("/catalog/products", response_model=Product)
-def add_product(body: ProductCreateRequest, admin: User = Depends(get_admin_user)) -> Product:
-    return platform.add_product(
-        name=body.name,
-        price=body.price,
-        stock=body.stock,
-        category_id=body.category_id,
-        acting_user=admin,
-        description=body.description,
+@app.post("/catalog/products", response_class=MsgspecJSONResponse)
+def add_product(
+    body: ProductCreateRequest = Depends(msgspec_body(ProductCreateRequest)),
+    admin: User = Depends(get_admin_user),
+):
+    return MsgspecJSONResponse(
+        platform.add_product(
+            name=body.name,
+            price=body.price,
+            stock=body.stock,
+            category_id=body.category_id,
+            acting_user=admin,
+            description=body.description,
+        )
     )
 
 
@@ -152,7 +249,10 @@ def delete_product(product_id: str, admin: User = Depends(get_admin_user)) -> No
 
 
 @app.post("/cart/items")
-def add_to_cart(body: CartItemRequest, user: User = Depends(get_current_user)):
+def add_to_cart(
+    body: CartItemRequest = Depends(msgspec_body(CartItemRequest)),
+    user: User = Depends(get_current_user),
+):
     try:
         platform.add_to_cart(user.id, body.product_id, body.quantity)
         return {"status": "added"}
@@ -161,61 +261,68 @@ def add_to_cart(body: CartItemRequest, user: User = Depends(get_current_user)):
 
 
 @app.delete("/cart/items")
-def remove_from_cart(body: CartItemRequest, user: User = Depends(get_current_user)):
+def remove_from_cart(
+    body: CartItemRequest = Depends(msgspec_body(CartItemRequest)),
+    user: User = Depends(get_current_user),
+):
     platform.remove_from_cart(user.id, body.product_id, body.quantity)
     return {"status": "removed"}
 
 
 @app.get("/cart")
-def view_cart(user: User = Depends(get_current_user)):
+async def view_cart(user: User = Depends(get_current_user)):
     cart = platform.get_cart(user.id)
-    return {
-        "items": [
-            {
-                "product_id": item.product.id,
-                "name": item.product.name,
-                "quantity": item.quantity,
-                "line_total": item.line_total,
-            }
-            for item in cart.items()
-        ],
-        "total": cart.total,
-    }
-
-
-@app.post("/checkout", response_model=Order)
-def checkout(body: CheckoutRequest, user: User = Depends(get_current_user)) -> Order:
+    return {"items": _cart_item_dicts(cart), "total": cart.total}
+
+
+@app.post("/checkout", response_class=MsgspecJSONResponse)
+def checkout(
+    body: CheckoutRequest = Depends(msgspec_body(CheckoutRequest)),
+    user: User = Depends(get_current_user),
+):
     try:
-        return platform.checkout(user.id, body.payment_method)
+        return MsgspecJSONResponse(platform.checkout(user.id, body.payment_method))
     except (ValueError, PaymentError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
-@app.get("/payments/{reference}", response_model=PaymentReceipt)
-def get_payment(reference: str, admin: User = Depends(get_admin_user)) -> PaymentReceipt:
+@app.get("/payments/{reference}", response_class=MsgspecJSONResponse)
+async def get_payment(reference: str, admin: User = Depends(get_admin_user)):
     try:
-        return platform.payment_processor.get_receipt(reference)
+        return MsgspecJSONResponse(platform.payment_processor.get_receipt(reference))
     except PaymentError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
 
 
-@app.post("/payments/{reference}/confirm", response_model=Order)
-def confirm_payment(reference: str, body: PaymentConfirmationRequest, admin: User = Depends(get_admin_user)):
+@app.post("/payments/{reference}/confirm", response_class=MsgspecJSONResponse)
+def confirm_payment(
+    reference: str,
+    body: PaymentConfirmationRequest = Depends(msgspec_body(PaymentConfirmationRequest)),
+    admin: User = Depends(get_admin_user),
+):
     try:
-        kwargs = body.dict(exclude_none=True)
-        return platform.confirm_payment(reference, **kwargs)
+        kwargs = {
+            key: value
+            for key, value in (
+                ("otp", body.otp),
+                ("transaction_id", body.transaction_id),
+                ("delivered", body.delivered),
+            )
+            if value is not None
+        }
+        return MsgspecJSONResponse(platform.confirm_payment(reference, **kwargs))
     except (PaymentError, AuthenticationError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
-@app.get("/orders", response_model=List[Order])
-def list_orders(admin: User = Depends(get_admin_user)) -> List[Order]:
-    return platform.list_orders(admin)
+@app.get("/orders", response_class=MsgspecJSONResponse)
+async def list_orders(admin: User = Depends(get_admin_user)):
+    return MsgspecJSONResponse(platform.list_orders(admin))
 
 
-@app.get("/orders/me", response_model=List[Order])
-def my_orders(user: User = Depends(get_current_user)) -> List[Order]:
-    return [order for order in platform.orders.values() if order.user_id == user.id]
+@app.get("/orders/me", response_class=MsgspecJSONResponse)
+async def my_orders(user: User = Depends(get_current_user)):
+    return MsgspecJSONResponse(platform.orders_for_user(user.id))
 
 
 # ----------------------------
@@ -223,49 +330,68 @@ def my_orders(user: User = Depends(get_current_user)) -> List[Order]:
 # ----------------------------
 
 
-def _user_from_cookie(request: Request) -> Optional[User]:
+# Session user for the in-flight request. The middleware below resolves the
+# cookie exactly once; handlers and helpers read the result with a single
+# contextvar get instead of repeating the auth-service lookup.
+_current_user: ContextVar[Optional[User]] = ContextVar("_current_user", default=None)
+
+
+@app.middleware("http")
+async def _resolve_session_user(request: Request, call_next):
+    user = None
     token = request.cookies.get("session_token")
-    if not token:
-        return None
+    if token:
+        try:
+            user = platform.auth_service.resolve_user(token)
+        except AuthenticationError:
+            user = None
+    ctx_token = _current_user.set(user)
     try:
-        return platform.auth_service.resolve_user(token)
-    except AuthenticationError:
-        return None
+        return await call_next(request)
+    finally:
+        _current_user.reset(ctx_token)
+
+
+def _user_from_cookie(request: Request) -> Optional[User]:
+    return _current_user.get()
 
 
 def _require_ui_user(request: Request) -> User:
-    user = _user_from_cookie(request)
+    user = _current_user.get()
     if not user:
         raise HTTPException(status_code=status.HTTP_302_FOUND, headers={"Location": "/login"})
     return user
 
 
 @app.get("/", response_class=HTMLResponse)
-def ui_store(request: Request):
+async def ui_store(request: Request, category: Optional[str] = None):
     user = _user_from_cookie(request)
-    products = list(platform.products.values())
-    categories = list(platform.categories.values())
-    return templates.TemplateResponse(
-        "store.html",
-        {
-            "request": request,
-            "title": "Store",
-            "products": products,
-            "categories": categories,
-            "current_user": user,
-            "message": None,
-        },
+    if category:
+        products = platform.products_in_category(category)
+    else:
+        products = platform.products_list()
+    categories = platform.categories_list()
+    # generate() yields rendered chunks, so the first bytes go out before the
+    # whole (potentially large) catalog page has been rendered.
+    return StreamingResponse(
+        STORE_TPL.generate(
+            _BASE_CTX,
+            title="Store",
+            products=products,
+            categories=categories,
+            current_user=user,
+        ),
+        media_type="text/html",
     )
 
 
 @app.get("/login", response_class=HTMLResponse)
-def ui_login_page(request: Request):
+async def ui_login_page(request: Request):
     user = _user_from_cookie(request)
     if user:
         return RedirectResponse(url="/", status_code=status.HTTP_302_FOUND)
-    return templates.TemplateResponse(
-        "login.html",
-        {"request": request, "title": "Login", "current_user": None, "message": None},
+    return HTMLResponse(
+        LOGIN_TPL.render(_BASE_CTX, title="Login")
     )
 
 
@@ -274,14 +400,8 @@ def ui_login(request: Request, username: str = Form(...), password: str = Form(.
     try:
         token = platform.auth_service.login(username, password)
     except AuthenticationError as exc:
-        return templates.TemplateResponse(
-            "login.html",
-            {
-                "request": request,
-                "title": "Login",
-                "current_user": None,
-                "message": str(exc),
-            },
+        return HTMLResponse(
+            LOGIN_TPL.render(_BASE_CTX, title="Login", message=str(exc)),
             status_code=status.HTTP_401_UNAUTHORIZED,
         )
     resp = RedirectResponse(url="/", status_code=status.HTTP_302_FOUND)
@@ -309,46 +429,34 @@ def ui_add_to_cart(
     try:
         platform.add_to_cart(user.id, product_id, quantity)
     except Exception as exc:
-        products = list(platform.products.values())
-        categories = list(platform.categories.values())
-        return templates.TemplateResponse(
-            "store.html",
-            {
-                "request": request,
-                "title": "Store",
-                "products": products,
-                "categories": categories,
-                "current_user": user,
-                "message": str(exc),
-            },
+        products = platform.products_list()
+        categories = platform.categories_list()
+        return HTMLResponse(
+            STORE_TPL.render(
+                _BASE_CTX,
+                title="Store",
+                products=products,
+                categories=categories,
+                current_user=user,
+                message=str(exc),
+            ),
             status_code=status.HTTP_400_BAD_REQUEST,
         )
     return RedirectResponse(url="/cart/view", status_code=status.HTTP_302_FOUND)
 
 
 @app.get("/cart/view", response_class=HTMLResponse)
-def ui_view_cart(request: Request):
+async def ui_view_cart(request: Request):
     user = _require_ui_user(request)
     cart = platform.get_cart(user.id)
-    items = [
-        {
-            "product_id": item.product.id,
-            "name": item.product.name,
-            "quantity": item.quantity,
-            "line_total": item.line_total,
-        }
-        for item in cart.items()
-    ]
-    return templates.TemplateResponse(
-        "cart.html",
-        {
-            "request": request,
-            "title": "Cart",
-            "items": items,
-            "total": cart.total,
-            "current_user": user,
-            "message": None,
-        },
+    return HTMLResponse(
+        CART_TPL.render(
+            _BASE_CTX,
+            title="Cart",
+            items=_cart_item_dicts(cart),
+            total=cart.total,
+            current_user=user,
+        )
     )
 
 
@@ -370,38 +478,26 @@ def ui_checkout(request: Request, payment_method: str = Form(...)):
                 receipt = platform.payment_processor.get_receipt(order.payment_reference)
             except PaymentError:
                 receipt = None
-        return templates.TemplateResponse(
-            "checkout_result.html",
-            {
-                "request": request,
-                "title": "Order placed",
-                "order": order,
-                "receipt": receipt,
-                "current_user": user,
-                "message": None,
-            },
+        return HTMLResponse(
+            CHECKOUT_RESULT_TPL.render(
+                _BASE_CTX,
+                title="Order placed",
+                order=order,
+                receipt=receipt,
+                current_user=user,
+            )
         )
     except (ValueError, PaymentError) as exc:
         cart = platform.get_cart(user.id)
-        items = [
-            {
-                "product_id": item.product.id,
-                "name": item.product.name,
-                "quantity": item.quantity,
-                "line_total": item.line_total,
-            }
-            for item in cart.items()
-        ]
-        return templates.TemplateResponse(
-            "cart.html",
-            {
-                "request": request,
-                "title": "Cart",
-                "items": items,
-                "total": cart.total,
-                "current_user": user,
-                "message": str(exc),
-            },
+        return HTMLResponse(
+            CART_TPL.render(
+                _BASE_CTX,
+                title="Cart",
+                items=_cart_item_dicts(cart),
+                total=cart.total,
+                current_user=user,
+                message=str(exc),
+            ),
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
@@ -415,39 +511,36 @@ def ui_confirm_payment(request: Request, reference: str, otp: Optional[str] = Fo
             kwargs["otp"] = otp
         order = platform.confirm_payment(reference, **kwargs)
         receipt = platform.payment_processor.get_receipt(reference)
-        return templates.TemplateResponse(
-            "checkout_result.html",
-            {
-                "request": request,
-                "title": "Payment confirmed",
-                "order": order,
-                "receipt": receipt,
-                "current_user": user,
-                "message": None,
-            },
+        return HTMLResponse(
+            CHECKOUT_RESULT_TPL.render(
+                _BASE_CTX,
+                title="Payment confirmed",
+                order=order,
+                receipt=receipt,
+                current_user=user,
+            )
         )
     except (PaymentError, AuthenticationError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
 @app.get("/admin", response_class=HTMLResponse)
-def ui_admin(request: Request):
+async def ui_admin(request: Request):
     user = _require_ui_user(request)
     require_admin(user)
-    categories = list(platform.categories.values())
-    products = list(platform.products.values())
+    categories = platform.categories_list()
+    products = platform.products_list()
     orders = platform.list_orders(user)
-    return templates.TemplateResponse(
-        "admin.html",
-        {
-            "request": request,
-            "title": "Admin",
-            "categories": categories,
-            "products": products,
-            "orders": orders,
-            "current_user": user,
-            "message": None,
-        },
+    return StreamingResponse(
+        ADMIN_TPL.generate(
+            _BASE_CTX,
+            title="Admin",
+            categories=categories,
+            products=products,
+            orders=orders,
+            current_user=user,
+        ),
+        media_type="text/html",
     )
 
 
@@ -486,17 +579,31 @@ def ui_admin_add_product(
 
 
 @app.get("/orders/me/ui", response_class=HTMLResponse)
-def ui_my_orders(request: Request):
+async def ui_my_orders(request: Request):
     user = _require_ui_user(request)
-    orders = [order for order in platform.orders.values() if order.user_id == user.id]
-    return templates.TemplateResponse(
-        "orders.html",
-        {
-            "request": request,
-            "title": "My orders",
-            "orders": orders,
-            "current_user": user,
-            "message": None,
-        },
+    orders = platform.orders_for_user(user.id)
+    return HTMLResponse(
+        ORDERS_TPL.render(
+            _BASE_CTX,
+            title="My orders",
+            orders=orders,
+            current_user=user,
+        )
     )
 
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop + httptools move the event loop and HTTP parsing into C,
+    # which lifts throughput over stdlib asyncio + h11 with no code changes.
+    # Single worker only: sessions, carts and orders live in this process's
+    # memory and platform_state.json has one debounced writer, so forked
+    # workers would each see a different store and race on the file.
+    uvicorn.run(
+        "ecommerce_system.api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+    )
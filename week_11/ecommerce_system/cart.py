@@ -2,41 +2,64 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Dict, Iterable
 
 from .models import CartItem, Product
 
+# Pool of recycled CartItem instances. Only items fully removed from a cart
+# truly die here — items that reach checkout are handed off to the Order and
+# must never be recycled — so that is the single release point.
+_CART_ITEM_POOL: deque = deque(maxlen=256)
+
+
+def _acquire_cart_item(product: Product, quantity: int) -> CartItem:
+    if _CART_ITEM_POOL:
+        item = _CART_ITEM_POOL.pop()
+        item.product = product
+        item.quantity = quantity
+        return item
+    return CartItem(product=product, quantity=quantity)
+
 
 @dataclass
 class ShoppingCart:
     user_id: str
     _items: Dict[str, CartItem] = field(default_factory=dict)
+    # Running subtotal in integer cents, maintained on every mutation so
+    # `total` is O(1) and the hot path never touches Decimal arithmetic.
+    _total_cents: int = field(default=0, repr=False)
 
     def add_item(self, product: Product, quantity: int = 1) -> None:
         if product.id in self._items:
             self._items[product.id].increment(quantity)
         else:
-            self._items[product.id] = CartItem(product=product, quantity=quantity)
+            self._items[product.id] = _acquire_cart_item(product, quantity)
+        self._total_cents += product.price_cents * quantity
 
     def remove_item(self, product_id: str, quantity: int = 1) -> None:
         if product_id not in self._items:
             return
         item = self._items[product_id]
+        removed = min(quantity, item.quantity)
         item.quantity -= quantity
         if item.quantity <= 0:
             del self._items[product_id]
+            _CART_ITEM_POOL.append(item)
+        self._total_cents -= item.product.price_cents * removed
 
     def clear(self) -> None:
         self._items.clear()
+        self._total_cents = 0
 
     def items(self) -> Iterable[CartItem]:
         return self._items.values()
 
     @property
     def total(self) -> Decimal:
-        return sum(item.line_total for item in self._items.values())
+        return Decimal(self._total_cents) / 100
 
     def is_empty(self) -> bool:
         return not self._items
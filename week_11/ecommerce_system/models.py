@@ -49,6 +49,17 @@ class Product(IdentifiableMixin, TimestampedMixin):
     category_id: str
     description: str = ""
     metadata: Dict[str, str] = field(default_factory=dict)
+    # Price in integer minor units (cents). Hot cart/order arithmetic runs on
+    # ints, which are an order of magnitude cheaper than Decimal operations;
+    # Decimal only appears at construction and serialization boundaries.
+    price_cents: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.price_cents = int((self.price * 100).to_integral_value())
+        # Serialized forms of the immutable fields, computed once here so
+        # persisting the catalog never re-formats them per product.
+        self._price_str = format(self.price, "f")
+        self._created_at_str = self.created_at.isoformat()
 
     def adjust_stock(self, quantity: int) -> None:
         new_stock = self.stock + quantity
@@ -61,7 +72,10 @@ class Product(IdentifiableMixin, TimestampedMixin):
         self.touch()
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ on the types created in volume
+# during cart views and checkout. The mixin-based entities above cannot use
+# slots: two slotted bases would give an instance lay-out conflict.
+@dataclass(slots=True)
 class CartItem:
     product: Product
     quantity: int
@@ -69,9 +83,13 @@ class CartItem:
     def increment(self, qty: int) -> None:
         self.quantity += qty
 
+    @property
+    def line_total_cents(self) -> int:
+        return self.product.price_cents * self.quantity
+
     @property
     def line_total(self) -> Decimal:
-        return self.product.price * self.quantity
+        return Decimal(self.line_total_cents) / 100
 
 
 class OrderStatus(str, Enum):
@@ -96,7 +114,7 @@ class Order(IdentifiableMixin, TimestampedMixin):
 
     @property
     def subtotal(self) -> Decimal:
-        return sum(item.line_total for item in self.items)
+        return Decimal(sum(item.line_total_cents for item in self.items)) / 100
 
     def mark_paid(self, reference: str) -> None:
         self.status = OrderStatus.PAID
@@ -107,7 +125,7 @@ class Order(IdentifiableMixin, TimestampedMixin):
         return ", ".join(f"{item.product.name} x{item.quantity}" for item in self.items)
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentReceipt:
     order_id: str
     method: str
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict
+from typing import Callable, Dict, Optional
 import secrets
-import uuid
 
 from .models import Order, PaymentReceipt, PaymentStatus
 
@@ -34,7 +34,7 @@ class CardPayment(PaymentStrategy):
     requires_confirmation: bool = True
 
     def pay(self, order: Order) -> PaymentReceipt:
-        reference = f"{self.processor}-{uuid.uuid4().hex[:8]}"
+        reference = f"{self.processor}-{secrets.token_hex(4)}"
         otp = f"{secrets.randbelow(900000) + 100000}"
         metadata = {"processor": self.processor, "challenge": "otp", "otp": otp}
         return PaymentReceipt(
@@ -64,7 +64,7 @@ class BankTransferPayment(PaymentStrategy):
     requires_confirmation: bool = True
 
     def pay(self, order: Order) -> PaymentReceipt:
-        reference = f"NEFT-{uuid.uuid4().hex[:6]}"
+        reference = f"NEFT-{secrets.token_hex(3)}"
         return PaymentReceipt(
             order_id=order.id,
             method=self.name,
@@ -86,7 +86,7 @@ class UpiPayment(PaymentStrategy):
     handle: str = "merchant@upi"
 
     def pay(self, order: Order) -> PaymentReceipt:
-        reference = f"UPI-{uuid.uuid4().hex[:10]}"
+        reference = f"UPI-{secrets.token_hex(5)}"
         return PaymentReceipt(
             order_id=order.id,
             method=self.name,
@@ -103,7 +103,7 @@ class CashOnDeliveryPayment(PaymentStrategy):
     requires_confirmation: bool = True
 
     def pay(self, order: Order) -> PaymentReceipt:
-        reference = f"COD-{uuid.uuid4().hex[:5]}"
+        reference = f"COD-{secrets.token_hex(3)}"
         return PaymentReceipt(
             order_id=order.id,
             method=self.name,
@@ -120,9 +120,17 @@ class CashOnDeliveryPayment(PaymentStrategy):
 
 
 class PaymentProcessor:
-    def __init__(self) -> None:
+    # Receipts kept hot in memory; beyond this the least recently touched
+    # entry is evicted so a long-running process does not grow without bound.
+    MAX_TRANSACTIONS = 8192
+
+    def __init__(
+        self,
+        cold_storage: Optional[Callable[[str, PaymentReceipt], None]] = None,
+    ) -> None:
         self._strategies: Dict[str, PaymentStrategy] = {}
-        self._transactions: Dict[str, PaymentReceipt] = {}
+        self._transactions: "OrderedDict[str, PaymentReceipt]" = OrderedDict()
+        self._cold_storage = cold_storage
 
     def register(self, strategy: PaymentStrategy) -> None:
         self._strategies[strategy.name] = strategy
@@ -139,12 +147,17 @@ class PaymentProcessor:
             raise PaymentError(f"Payment method '{method}' is not available.")
         receipt = strategy.pay(order)
         self._transactions[receipt.reference] = receipt
+        if len(self._transactions) > self.MAX_TRANSACTIONS:
+            evicted_reference, evicted = self._transactions.popitem(last=False)
+            if self._cold_storage:
+                self._cold_storage(evicted_reference, evicted)
         return receipt
 
     def complete(self, reference: str, **kwargs) -> PaymentReceipt:
         receipt = self._transactions.get(reference)
         if not receipt:
             raise PaymentError("Payment reference not found.")
+        self._transactions.move_to_end(reference)
         strategy = self._strategies.get(receipt.method)
         if not strategy or not strategy.requires_confirmation:
             raise PaymentError(f"Payment method '{receipt.method}' cannot be confirmed manually.")
@@ -156,4 +169,5 @@ class PaymentProcessor:
         receipt = self._transactions.get(reference)
         if not receipt:
             raise PaymentError("Payment reference not found.")
+        self._transactions.move_to_end(reference)
         return receipt
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import atexit
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List, Optional
+from time import monotonic
+from typing import Dict, List, Optional, Set, Tuple
 
 from .cart import ShoppingCart
 from .models import Category, Order, OrderStatus, PaymentStatus, Product
@@ -28,15 +30,49 @@ def _require_admin(user: User) -> None:
         raise AuthorizationError("Administrator privileges required.")
 
 
-@dataclass
+@dataclass(slots=True)
 class ECommercePlatform:
     auth_service: AuthService
     payment_processor: PaymentProcessor
     storage: Optional[PlatformStorage] = None
+    # Persistence is debounced: mutations mark a section dirty and the
+    # snapshot is flushed when enough operations or time accumulate, at
+    # checkout/confirmation boundaries, and at process exit.
+    flush_interval: float = 1.0
+    max_batch_size: int = 50
     categories: Dict[str, Category] = field(default_factory=dict)
     products: Dict[str, Product] = field(default_factory=dict)
     carts: Dict[str, ShoppingCart] = field(default_factory=dict)
     orders: Dict[str, Order] = field(default_factory=dict)
+    # Lazily rebuilt snapshots so listing endpoints return an O(1) cached
+    # tuple instead of copying the whole dict on every request.
+    _categories_snapshot: Optional[Tuple[Category, ...]] = field(
+        default=None, init=False, repr=False
+    )
+    _products_snapshot: Optional[Tuple[Product, ...]] = field(
+        default=None, init=False, repr=False
+    )
+    # Secondary indexes so per-user order lookups and category filters avoid
+    # scanning the whole orders/products dicts.
+    _orders_by_user: Dict[str, List[Order]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _products_by_cat: Dict[str, Dict[str, Product]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _orders_by_ref: Dict[str, Order] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _dirty_catalog: bool = field(default=False, init=False, repr=False)
+    _dirty_orders: bool = field(default=False, init=False, repr=False)
+    # Ids touched since the last flush; lets the flush serialize only the
+    # changed catalog entries instead of the whole catalog.
+    _dirty_category_ids: Set[str] = field(default_factory=set, init=False, repr=False)
+    _dirty_product_ids: Set[str] = field(default_factory=set, init=False, repr=False)
+    _dropped_category_ids: Set[str] = field(default_factory=set, init=False, repr=False)
+    _dropped_product_ids: Set[str] = field(default_factory=set, init=False, repr=False)
+    _pending_ops: int = field(default=0, init=False, repr=False)
+    _pending_since: Optional[float] = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.storage:
@@ -44,12 +80,40 @@ class ECommercePlatform:
             self.categories.update(categories)
             self.products.update(products)
             self.orders.update(self.storage.load_orders(self.products))
+        for order in self.orders.values():
+            self._orders_by_user.setdefault(order.user_id, []).append(order)
+            if order.payment_reference:
+                self._orders_by_ref[order.payment_reference] = order
+        for product in self.products.values():
+            self._products_by_cat.setdefault(product.category_id, {})[product.id] = product
+        if self.storage:
+            atexit.register(self.flush)
 
     # ---- Category management ----
+    def categories_list(self) -> Tuple[Category, ...]:
+        if self._categories_snapshot is None:
+            self._categories_snapshot = tuple(self.categories.values())
+        return self._categories_snapshot
+
+    def products_list(self) -> Tuple[Product, ...]:
+        if self._products_snapshot is None:
+            self._products_snapshot = tuple(self.products.values())
+        return self._products_snapshot
+
+    def products_in_category(self, category_id: str) -> List[Product]:
+        members = self._products_by_cat.get(category_id)
+        return list(members.values()) if members else []
+
+    def _invalidate_snapshots(self) -> None:
+        self._categories_snapshot = None
+        self._products_snapshot = None
+
     def create_category(self, name: str, description: str, acting_user: User) -> Category:
         _require_admin(acting_user)
         category = Category(name=name, description=description)
         self.categories[category.id] = category
+        self._dirty_category_ids.add(category.id)
+        self._invalidate_snapshots()
         self._persist_catalog()
         return category
 
@@ -57,9 +121,11 @@ class ECommercePlatform:
         _require_admin(acting_user)
         if category_id in self.categories:
             del self.categories[category_id]
-        for product in list(self.products.values()):
-            if product.category_id == category_id:
-                del self.products[product.id]
+            self._dropped_category_ids.add(category_id)
+        for product_id in self._products_by_cat.pop(category_id, {}):
+            del self.products[product_id]
+            self._dropped_product_ids.add(product_id)
+        self._invalidate_snapshots()
         self._persist_catalog()
 
     # ---- Product management ----
@@ -83,12 +149,21 @@ class ECommercePlatform:
             description=description,
         )
         self.products[product.id] = product
+        self._products_by_cat.setdefault(product.category_id, {})[product.id] = product
+        self._dirty_product_ids.add(product.id)
+        self._invalidate_snapshots()
         self._persist_catalog()
         return product
 
     def remove_product(self, product_id: str, acting_user: User) -> None:
         _require_admin(acting_user)
-        self.products.pop(product_id, None)
+        product = self.products.pop(product_id, None)
+        if product is not None:
+            siblings = self._products_by_cat.get(product.category_id)
+            if siblings is not None:
+                siblings.pop(product_id, None)
+            self._dropped_product_ids.add(product_id)
+        self._invalidate_snapshots()
         self._persist_catalog()
 
     # ---- Cart operations ----
@@ -106,6 +181,7 @@ class ECommercePlatform:
         product.adjust_stock(-quantity)
         cart = self.get_cart(user_id)
         cart.add_item(product, quantity)
+        self._dirty_product_ids.add(product_id)
         self._persist_catalog()
 
     def remove_from_cart(self, user_id: str, product_id: str, quantity: int = 1) -> None:
@@ -114,6 +190,7 @@ class ECommercePlatform:
         product = self.products.get(product_id)
         if product:
             product.adjust_stock(quantity)
+            self._dirty_product_ids.add(product_id)
             self._persist_catalog()
 
     # ---- Checkout ----
@@ -130,21 +207,31 @@ class ECommercePlatform:
             order.payment_reference = receipt.reference
             for item in order.items:
                 item.product.adjust_stock(item.quantity)
+                self._dirty_product_ids.add(item.product.id)
             self._persist_catalog()
         else:
             order.payment_reference = receipt.reference
         self.orders[order.id] = order
-        self._persist_orders()
+        self._orders_by_user.setdefault(order.user_id, []).append(order)
+        if order.payment_reference:
+            self._orders_by_ref[order.payment_reference] = order
+        # One small log append per checkout instead of rewriting the history.
+        if self.storage:
+            self.storage.persist_order_delta(order)
         cart.clear()
+        self.flush()
         return order
 
     def list_orders(self, acting_user: User) -> List[Order]:
         _require_admin(acting_user)
         return list(self.orders.values())
 
+    def orders_for_user(self, user_id: str) -> List[Order]:
+        return self._orders_by_user.get(user_id, [])
+
     def confirm_payment(self, reference: str, **kwargs) -> Order:
         receipt = self.payment_processor.complete(reference, **kwargs)
-        order = next((o for o in self.orders.values() if o.payment_reference == reference), None)
+        order = self._orders_by_ref.get(reference)
         if not order:
             raise NotFoundError("Order for reference not found.")
         if receipt.status == PaymentStatus.SUCCESS:
@@ -153,17 +240,55 @@ class ECommercePlatform:
             order.status = OrderStatus.FAILED
             for item in order.items:
                 item.product.adjust_stock(item.quantity)
+                self._dirty_product_ids.add(item.product.id)
             self._persist_catalog()
-        self._persist_orders()
+        if self.storage:
+            self.storage.persist_order_delta(order)
+        self.flush()
         return order
 
     def _persist_catalog(self) -> None:
-        if self.storage:
-            self.storage.persist_catalog(self.categories, self.products)
+        self._mark_dirty(catalog=True)
 
     def _persist_orders(self) -> None:
-        if self.storage:
+        self._mark_dirty(orders=True)
+
+    def _mark_dirty(self, catalog: bool = False, orders: bool = False) -> None:
+        if not self.storage:
+            return
+        now = monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        self._dirty_catalog = self._dirty_catalog or catalog
+        self._dirty_orders = self._dirty_orders or orders
+        self._pending_ops += 1
+        if (
+            self._pending_ops >= self.max_batch_size
+            or now - self._pending_since >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any dirty sections to storage immediately."""
+        if not self.storage:
+            return
+        if self._dirty_catalog:
+            self.storage.persist_catalog_delta(
+                {cid: self.categories[cid] for cid in self._dirty_category_ids if cid in self.categories},
+                {pid: self.products[pid] for pid in self._dirty_product_ids if pid in self.products},
+                dropped_category_ids=self._dropped_category_ids,
+                dropped_product_ids=self._dropped_product_ids,
+            )
+            self._dirty_category_ids.clear()
+            self._dirty_product_ids.clear()
+            self._dropped_category_ids.clear()
+            self._dropped_product_ids.clear()
+            self._dirty_catalog = False
+        if self._dirty_orders:
             self.storage.persist_orders(self.orders)
+            self._dirty_orders = False
+        self._pending_ops = 0
+        self._pending_since = None
 
 
 def bootstrap_platform(storage: Optional[PlatformStorage] = None) -> ECommercePlatform:
@@ -4,10 +4,17 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 import json
+import os
 from pathlib import Path
+
+try:  # C-accelerated codec; stdlib json remains as fallback.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 from threading import Lock
-from typing import Callable, Dict, Iterable, List, Tuple, Type
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
 
 from .models import Category, Order, OrderStatus, Product
 from .cart import CartItem
@@ -18,6 +25,9 @@ def _dt_to_str(value: datetime) -> str:
     return value.isoformat()
 
 
+# Bulk-imported records tend to share identical timestamps, so memoizing the
+# parse turns O(rows) fromisoformat calls into O(unique timestamps).
+@lru_cache(maxsize=8192)
 def _dt_from_str(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
@@ -52,12 +62,12 @@ def _serialize_product(product: Product) -> Dict[str, str]:
     return {
         "id": product.id,
         "name": product.name,
-        "price": _serialize_decimal(product.price),
+        "price": product._price_str,
         "stock": product.stock,
         "category_id": product.category_id,
         "description": product.description,
         "metadata": product.metadata,
-        "created_at": _dt_to_str(product.created_at),
+        "created_at": product._created_at_str,
         "updated_at": _dt_to_str(product.updated_at),
     }
 
@@ -73,6 +83,7 @@ def _deserialize_product(payload: Dict[str, str]) -> Product:
     )
     product.id = payload["id"]
     product.created_at = _dt_from_str(payload["created_at"])
+    product._created_at_str = payload["created_at"]
     product.updated_at = _dt_from_str(payload["updated_at"])
     return product
 
@@ -127,14 +138,14 @@ def _serialize_user(user: User) -> Dict[str, str]:
 
 
 def _deserialize_user(payload: Dict[str, str], user_cls: Type[User]) -> User:
-    kwargs = {
-        "username": payload["username"],
-        "full_name": payload["full_name"],
-        "password": "placeholder",
-    }
-    user = user_cls.from_plain_password(**kwargs)  # type: ignore[arg-type]
+    # Instantiate directly with the stored hash; going through
+    # from_plain_password would derive a throwaway hash per user at load time.
+    user = user_cls(
+        username=payload["username"],
+        full_name=payload["full_name"],
+        _password_hash=payload["_password_hash"],
+    )
     user.id = payload["id"]
-    user._password_hash = payload["_password_hash"]
     user.active = payload.get("active", True)
     if hasattr(user, "shipping_address"):
         setattr(user, "shipping_address", payload.get("shipping_address", ""))
@@ -148,9 +159,20 @@ def _deserialize_user(payload: Dict[str, str], user_cls: Type[User]) -> User:
 class PlatformStorage:
     """Thread-safe JSON persistence for platform state."""
 
-    def __init__(self, path: str = "data/platform_state.json") -> None:
+    # Orders append to a newline-delimited log; once it grows past this the
+    # log is folded into the snapshot file and truncated.
+    MAX_LOG_BYTES = 10 * 1024 * 1024
+
+    def __init__(self, path: str = "data/platform_state.json", durable: bool = False) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.orders_log = self.path.parent / "orders.log"
+        # durable=True buys crash safety (temp file + fsync of data and
+        # directory); the default writes in place and skips the extra
+        # syscalls, which is plenty for dev/test state files.
+        self.durable = durable
+        # Guards file writes only. In-memory reads never take it: published
+        # section dicts are replaced, not mutated, so load_* stays lock-free.
         self._lock = Lock()
         if not self.path.exists():
             self._write(
@@ -161,55 +183,153 @@ class PlatformStorage:
                     "orders": {},
                 }
             )
+        # Hydrated once at construction; every load and persist works against
+        # this in-memory snapshot, so persisting one section no longer
+        # re-reads and re-parses the whole file first.
+        self._snapshot: Dict[str, Dict] = self._read()
+        self._replay_orders_log()
+        # Deserialized-object caches: repeated loads return the same hydrated
+        # dicts, and persist_* refreshes them straight from its arguments so
+        # nothing is re-parsed after a write.
+        self._cat_cache: Optional[Tuple[Dict[str, Category], Dict[str, Product]]] = None
+        self._orders_cache: Optional[Dict[str, Order]] = None
 
     def _read(self) -> Dict[str, Dict]:
-        with self._lock:
-            with self.path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
+        # No lock: readers work against immutable-once-published dicts, and
+        # the snapshot reference itself is swapped atomically (CPython), so
+        # only the file writes below need serializing.
+        data = self.path.read_bytes()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
 
     def _write(self, payload: Dict[str, Dict]) -> None:
+        # Compact output: pretty-printing roughly doubles the bytes written
+        # on every flush for no runtime benefit.
+        if orjson is not None:
+            encoded = orjson.dumps(payload)
+        else:
+            encoded = json.dumps(payload, indent=2).encode("utf-8")
         with self._lock:
+            if not self.durable:
+                self.path.write_bytes(encoded)
+                return
             temp_path = self.path.with_suffix(".tmp")
-            with temp_path.open("w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2)
+            with temp_path.open("wb") as handle:
+                handle.write(encoded)
+                handle.flush()
+                os.fsync(handle.fileno())
             temp_path.replace(self.path)
+            dir_fd = os.open(self.path.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
     def load_catalog(self) -> Tuple[Dict[str, Category], Dict[str, Product]]:
-        snapshot = self._read()
-        categories = {
-            cid: _deserialize_category(data) for cid, data in snapshot.get("categories", {}).items()
-        }
-        products = {
-            pid: _deserialize_product(data) for pid, data in snapshot.get("products", {}).items()
-        }
-        return categories, products
+        if self._cat_cache is None:
+            snapshot = self._snapshot
+            categories = {
+                cid: _deserialize_category(data)
+                for cid, data in snapshot.get("categories", {}).items()
+            }
+            products = {
+                pid: _deserialize_product(data)
+                for pid, data in snapshot.get("products", {}).items()
+            }
+            self._cat_cache = (categories, products)
+        return self._cat_cache
 
     def load_orders(self, products: Dict[str, Product]) -> Dict[str, Order]:
-        snapshot = self._read()
-        orders = {
-            oid: _deserialize_order(data, products) for oid, data in snapshot.get("orders", {}).items()
-        }
-        return orders
+        if self._orders_cache is None:
+            snapshot = self._snapshot
+            self._orders_cache = {
+                oid: _deserialize_order(data, products)
+                for oid, data in snapshot.get("orders", {}).items()
+            }
+        return self._orders_cache
 
     def load_users(self) -> Dict[str, Dict]:
-        snapshot = self._read()
-        return snapshot.get("users", {})
+        return self._snapshot.get("users", {})
 
     def persist_catalog(self, categories: Dict[str, Category], products: Dict[str, Product]) -> None:
-        snapshot = self._read()
-        snapshot["categories"] = {cid: _serialize_category(cat) for cid, cat in categories.items()}
-        snapshot["products"] = {pid: _serialize_product(prod) for pid, prod in products.items()}
-        self._write(snapshot)
+        self._cat_cache = (categories, products)
+        self._snapshot["categories"] = {
+            cid: _serialize_category(cat) for cid, cat in categories.items()
+        }
+        self._snapshot["products"] = {
+            pid: _serialize_product(prod) for pid, prod in products.items()
+        }
+        self._write(self._snapshot)
+
+    def _replay_orders_log(self) -> None:
+        if not self.orders_log.exists():
+            return
+        orders = self._snapshot.setdefault("orders", {})
+        with self.orders_log.open("rb") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                payload = orjson.loads(line) if orjson is not None else json.loads(line)
+                orders[payload["id"]] = payload
+
+    def persist_order_delta(self, order: Order) -> None:
+        """Append one order to the log instead of rewriting the whole history."""
+        payload = _serialize_order(order)
+        self._snapshot.setdefault("orders", {})[order.id] = payload
+        if self._orders_cache is not None:
+            self._orders_cache[order.id] = order
+        encoded = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+        with self._lock:
+            with self.orders_log.open("ab") as handle:
+                handle.write(encoded + b"\n")
+                log_size = handle.tell()
+        if log_size > self.MAX_LOG_BYTES:
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the order log into the snapshot file and truncate the log."""
+        self._write(self._snapshot)
+        with self._lock:
+            if self.orders_log.exists():
+                self.orders_log.unlink()
+
+    def persist_catalog_delta(
+        self,
+        categories: Dict[str, Category],
+        products: Dict[str, Product],
+        dropped_category_ids: Iterable[str] = (),
+        dropped_product_ids: Iterable[str] = (),
+    ) -> None:
+        """Merge only the changed entries into the snapshot, rather than
+        re-serializing every category and product on each flush."""
+        # Copy-then-swap: build the updated sections aside and publish each
+        # with a single (atomic) assignment, so lock-free readers iterating
+        # the old dicts never observe a half-applied delta.
+        cat_section = dict(self._snapshot.get("categories", {}))
+        prod_section = dict(self._snapshot.get("products", {}))
+        for cid in dropped_category_ids:
+            cat_section.pop(cid, None)
+        for pid in dropped_product_ids:
+            prod_section.pop(pid, None)
+        for cid, category in categories.items():
+            cat_section[cid] = _serialize_category(category)
+        for pid, product in products.items():
+            prod_section[pid] = _serialize_product(product)
+        self._snapshot["categories"] = cat_section
+        self._snapshot["products"] = prod_section
+        self._cat_cache = None
+        self._write(self._snapshot)
 
     def persist_orders(self, orders: Dict[str, Order]) -> None:
-        snapshot = self._read()
-        snapshot["orders"] = {oid: _serialize_order(order) for oid, order in orders.items()}
-        self._write(snapshot)
+        self._orders_cache = orders
+        self._snapshot["orders"] = {oid: _serialize_order(order) for oid, order in orders.items()}
+        self._write(self._snapshot)
 
     def persist_users(self, users: Dict[str, Dict]) -> None:
-        snapshot = self._read()
-        snapshot["users"] = users
-        self._write(snapshot)
+        self._snapshot["users"] = users
+        self._write(self._snapshot)
 
     def persist_user_objects(self, users: Dict[str, User]) -> None:
         serialized = {username: _serialize_user(user) for username, user in users.items()}
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import atexit
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+import functools
 import hashlib
+import heapq
+import hmac
 import secrets
 from typing import Dict, Optional, Type
 import uuid
@@ -18,19 +22,31 @@ class AuthorizationError(RuntimeError):
     pass
 
 
-def _hash_password(password: str, salt: Optional[str] = None) -> str:
-    salt = salt or secrets.token_hex(8)
-    digest = hashlib.sha256(f"{salt}:{password}".encode("utf-8")).hexdigest()
-    return f"{salt}${digest}"
+_PBKDF2_ITERATIONS = 100_000
+
+
+def _hash_password(password: str, salt: Optional[bytes] = None) -> str:
+    salt = salt or secrets.token_bytes(16)
+    # pbkdf2_hmac runs in C and releases the GIL; working on bytes end to end
+    # avoids the per-call string concatenations of the old salted-SHA256 path.
+    derived = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, _PBKDF2_ITERATIONS)
+    return f"pbkdf2${salt.hex()}${derived.hex()}"
 
 
 def _verify_password(password: str, hashed: str) -> bool:
+    if hashed.startswith("pbkdf2$"):
+        _, salt_hex, digest_hex = hashed.split("$", 2)
+        check = hashlib.pbkdf2_hmac(
+            "sha256", password.encode("utf-8"), bytes.fromhex(salt_hex), _PBKDF2_ITERATIONS
+        )
+        return hmac.compare_digest(check, bytes.fromhex(digest_hex))
+    # Legacy salted-SHA256 hashes persisted before the pbkdf2 switch.
     salt, digest = hashed.split("$", 1)
     check = hashlib.sha256(f"{salt}:{password}".encode("utf-8")).hexdigest()
     return secrets.compare_digest(check, digest)
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     username: str
     full_name: str
@@ -50,14 +66,24 @@ class User:
     def set_password(self, password: str) -> None:
         self._password_hash = _hash_password(password)
 
-    def is_locked(self) -> bool:
-        now = datetime.now(timezone.utc)
+    def is_locked(self, now: Optional[datetime] = None) -> bool:
+        # Callers on the login path pass their own `now` so one clock read
+        # serves the whole attempt.
+        if now is None:
+            now = datetime.now(timezone.utc)
         return bool(self.locked_until and self.locked_until > now)
 
-    def register_failed_login(self, max_attempts: int, lock_duration: timedelta) -> None:
+    def register_failed_login(
+        self,
+        max_attempts: int,
+        lock_duration: timedelta,
+        now: Optional[datetime] = None,
+    ) -> None:
         self.failed_attempts += 1
         if self.failed_attempts >= max_attempts:
-            self.locked_until = datetime.now(timezone.utc) + lock_duration
+            if now is None:
+                now = datetime.now(timezone.utc)
+            self.locked_until = now + lock_duration
             self.failed_attempts = 0
 
     def reset_lock(self) -> None:
@@ -65,27 +91,37 @@ class User:
         self.locked_until = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AdminUser(User):
     role: str = "admin"
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerUser(User):
     shipping_address: str = ""
     role: str = "customer"
 
 
-@dataclass
+@dataclass(slots=True)
 class SupportUser(User):
     role: str = "support"
 
 
-@dataclass
+@dataclass(slots=True)
 class FulfillmentUser(User):
     role: str = "fulfillment"
 
 
+# Built once at import; resolving a role per hydrated user should not
+# allocate the same dict every call.
+_USER_CLASS_REGISTRY: Dict[str, Type[User]] = {
+    "admin": AdminUser,
+    "customer": CustomerUser,
+    "support": SupportUser,
+    "fulfillment": FulfillmentUser,
+}
+
+
 class AuthService:
     """Authentication + authorization with persistence hooks."""
 
@@ -97,8 +133,22 @@ class AuthService:
         self._users: Dict[str, User] = {}
         self._sessions: Dict[str, str] = {}
         self._reset_tokens: Dict[str, Dict[str, datetime]] = {}
+        # Min-heap of (expires_at, token) mirroring _reset_tokens; lets the
+        # reset path lazily evict expired tokens instead of letting unused
+        # ones accumulate forever.
+        self._reset_heap: list[tuple[datetime, str]] = []
         if self._storage:
             self._users = self._storage.load_user_objects(self._resolve_user_class)
+            # Failed-attempt counters are written lazily; make sure the last
+            # state reaches disk on shutdown.
+            atexit.register(self._persist)
+        # Parallel index so session resolution is a dict hit instead of a
+        # scan over every user; kept in sync with _users on register/delete.
+        self._users_by_id: Dict[str, User] = {u.id: u for u in self._users.values()}
+        # Bounded memo of token -> User so every authenticated request does a
+        # single cache hit instead of a session lookup plus user scan. Cleared
+        # whenever a session or user it may reference goes away.
+        self._resolve_cached = functools.lru_cache(maxsize=8192)(self._resolve_user_uncached)
 
     def register_user(self, user: User, acting_user: Optional[User] = None) -> None:
         if isinstance(user, AdminUser) and acting_user is not None and acting_user.role != "admin":
@@ -106,17 +156,24 @@ class AuthService:
         if user.username in self._users:
             raise ValueError(f"User {user.username} already exists.")
         self._users[user.username] = user
+        self._users_by_id[user.id] = user
         self._persist()
 
     def login(self, username: str, password: str) -> str:
         user = self._users.get(username)
         if not user or not user.active:
             raise AuthenticationError("Invalid credentials.")
-        if user.is_locked():
+        now = datetime.now(timezone.utc)
+        if user.is_locked(now):
             raise AuthenticationError("Account temporarily locked.")
         if not user.verify_password(password):
-            user.register_failed_login(self.MAX_FAILED_ATTEMPTS, self.LOCK_DURATION)
-            self._persist()
+            user.register_failed_login(self.MAX_FAILED_ATTEMPTS, self.LOCK_DURATION, now=now)
+            # Persisting every failed attempt turns a dictionary attack into
+            # one full JSON write per guess. Only the lockout transition
+            # (failed_attempts reset to 0) hits disk; intermediate counters
+            # are flushed on the next successful login or at exit.
+            if user.failed_attempts == 0:
+                self._persist()
             raise AuthenticationError("Invalid credentials.")
         user.reset_lock()
         token = secrets.token_urlsafe(24)
@@ -126,15 +183,19 @@ class AuthService:
 
     def logout(self, token: str) -> None:
         self._sessions.pop(token, None)
+        self._resolve_cached.cache_clear()
 
     def resolve_user(self, token: str) -> User:
+        return self._resolve_cached(token)
+
+    def _resolve_user_uncached(self, token: str) -> User:
         user_id = self._sessions.get(token)
         if not user_id:
             raise AuthenticationError("Session expired.")
-        for user in self._users.values():
-            if user.id == user_id:
-                return user
-        raise AuthenticationError("User no longer exists.")
+        user = self._users_by_id.get(user_id)
+        if user is None:
+            raise AuthenticationError("User no longer exists.")
+        return user
 
     def get_user(self, username: str) -> Optional[User]:
         return self._users.get(username)
@@ -143,7 +204,10 @@ class AuthService:
         require_admin(acting_user)
         if username == acting_user.username:
             raise AuthorizationError("Admins cannot delete themselves.")
-        self._users.pop(username, None)
+        removed = self._users.pop(username, None)
+        if removed is not None:
+            self._users_by_id.pop(removed.id, None)
+        self._resolve_cached.cache_clear()
         self._persist()
 
     def list_users(self) -> Dict[str, User]:
@@ -154,8 +218,15 @@ class AuthService:
         if not user:
             raise AuthenticationError("User not found.")
         token = secrets.token_urlsafe(16)
-        expiry = datetime.now(timezone.utc) + timedelta(minutes=30)
+        now = datetime.now(timezone.utc)
+        expiry = now + timedelta(minutes=30)
         self._reset_tokens[token] = {"username": username, "expires_at": expiry}
+        heapq.heappush(self._reset_heap, (expiry, token))
+        # Sweep anything that expired; amortized O(log n) per request keeps
+        # both structures bounded by the number of live tokens.
+        while self._reset_heap and self._reset_heap[0][0] < now:
+            _, expired_token = heapq.heappop(self._reset_heap)
+            self._reset_tokens.pop(expired_token, None)
         return token
 
     def reset_password(self, token: str, new_password: str) -> None:
@@ -167,6 +238,7 @@ class AuthService:
         user.set_password(new_password)
         user.reset_lock()
         self._reset_tokens.pop(token, None)
+        self._resolve_cached.cache_clear()
         self._persist()
 
     def unlock_user(self, username: str, acting_user: User) -> None:
@@ -183,14 +255,7 @@ class AuthService:
 
     @staticmethod
     def _resolve_user_class(payload: Dict[str, str]) -> Type[User]:
-        role = payload.get("role", "customer")
-        registry: Dict[str, Type[User]] = {
-            "admin": AdminUser,
-            "customer": CustomerUser,
-            "support": SupportUser,
-            "fulfillment": FulfillmentUser,
-        }
-        return registry.get(role, CustomerUser)
+        return _USER_CLASS_REGISTRY.get(payload.get("role", "customer"), CustomerUser)
 
 
 def require_admin(user: User) -> None:
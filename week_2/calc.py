@@ -1,30 +1,29 @@
 # Student Grade Calculator
 
-students = []
+import numpy as np
+
+# Grade boundaries as a sorted lookup table: searchsorted maps every mark to
+# its band in one vectorized pass instead of an if/elif chain per student.
+BINS = np.array([40, 60, 75, 90])
+GRADES = np.array(["F", "C", "B", "A", "A+"])
+COMMENTS = np.array(["Failed", "Needs Improvement", "Good", "Very Good", "Excellent"])
+
+names = []
+marks_list = []
 num_students = int(input("Enter number of students: "))
 
 for i in range(num_students):
     name = input(f"\nEnter student {i+1} name: ")
     marks = int(input("Enter marks (out of 100): "))
+    names.append(name)
+    marks_list.append(marks)
 
-    # Determine grade
-    if marks >= 90:
-        grade = "A+"
-        comment = "Excellent"
-    elif marks >= 75:
-        grade = "A"
-        comment = "Very Good"
-    elif marks >= 60:
-        grade = "B"
-        comment = "Good"
-    elif marks >= 40:
-        grade = "C"
-        comment = "Needs Improvement"
-    else:
-        grade = "F"
-        comment = "Failed"
+marks_array = np.array(marks_list, dtype=np.int64)
+idx = np.searchsorted(BINS, marks_array, side="right")
+student_grades = GRADES[idx]
+student_comments = COMMENTS[idx]
 
-    students.append([name, marks, grade, comment])
+students = list(zip(names, marks_list, student_grades, student_comments))
 
 print("\n--- Student Grades ---")
 for student in students:
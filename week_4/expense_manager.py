@@ -1,23 +1,49 @@
+import atexit
 import csv
 from datetime import datetime
 
 FILE = "data/expenses.csv"
+FLUSH_EVERY = 50
+
+# The append handle stays open across calls so each expense is one buffered
+# writerow instead of an open/write/close syscall round-trip. Rows hit disk
+# every FLUSH_EVERY writes, before any read, and at interpreter exit.
+_fh = None
+_writer = None
+_pending_rows = 0
+
+def _get_writer():
+    global _fh, _writer
+    if _writer is None:
+        _fh = open(FILE, "a", newline="", buffering=8192)
+        _writer = csv.writer(_fh)
+        atexit.register(_fh.close)
+    return _writer
+
+def flush_pending():
+    global _pending_rows
+    if _fh is not None and _pending_rows:
+        _fh.flush()
+        _pending_rows = 0
 
 def add_expense():
+    global _pending_rows
     amount = input("Enter amount: ")
     category = input("Enter category: ")
     note = input("Enter note: ")
     date = datetime.now().strftime("%Y-%m-%d")
 
     try:
-        with open(FILE, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([date, amount, category, note])
+        _get_writer().writerow([date, amount, category, note])
+        _pending_rows += 1
+        if _pending_rows >= FLUSH_EVERY:
+            flush_pending()
         print("Expense added successfully!")
     except Exception as e:
         print("Error writing to file:", e)
 
 def view_expenses():
+    flush_pending()
     try:
         with open(FILE, "r") as f:
             reader = csv.reader(f)
@@ -1,10 +1,51 @@
 import csv
 from collections import defaultdict
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from expense_manager import flush_pending
+
+FILE = "data/expenses.csv"
+
 def generate_monthly_report():
+    flush_pending()  # expenses added this session may still be buffered
+    if pd is not None:
+        _report_pandas()
+    else:
+        _report_python()
+
+def _report_pandas():
+    # Vectorized path: the CSV is parsed in C and the month totals come from
+    # one groupby instead of per-row Python work.
+    try:
+        df = pd.read_csv(
+            FILE,
+            names=["date", "amount", "category", "note"],
+            header=None,
+            dtype={"date": "string", "amount": "float64"},
+            usecols=["date", "amount"],
+        )
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        # The lazily opened append handle creates the file empty, and
+        # older pandas refuses to parse a zero-byte CSV
+        print("No data available for report.")
+        return
+    if df.empty:
+        # Newer pandas hands back an empty frame for a zero-byte file
+        # instead of raising
+        print("No data available for report.")
+        return
+    totals = df.groupby(df["date"].str.slice(0, 7))["amount"].sum()
+    for month, total in totals.items():
+        print(f"{month}: ₹{total:.2f}")
+
+def _report_python():
     expenses = defaultdict(float)
     try:
-        with open("data/expenses.csv") as f:
+        with open(FILE) as f:
             reader = csv.reader(f)
             for date, amount, category, note in reader:
                 month = date[:7]
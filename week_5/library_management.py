@@ -4,6 +4,10 @@
 # ------------------------------------------------------------
 
 class Book:
+    # Slots drop the per-instance __dict__ — thousands of books stay small
+    # and attribute access becomes a fixed offset instead of a dict probe.
+    __slots__ = ("title", "author", "isbn", "available")
+
     def __init__(self, title, author, isbn):
         self.title = title
         self.author = author
@@ -22,15 +26,19 @@ class Book:
 
 
 class Member:
+    __slots__ = ("name", "member_id", "borrowed_books")
+
     def __init__(self, name, member_id):
         self.name = name
         self.member_id = member_id
-        self.borrowed_books = []
+        # Set rather than list: membership test and removal on return are
+        # O(1). Book uses identity hashing, which is what we want here.
+        self.borrowed_books = set()
 
     def borrow_book(self, book):
         if book.available:
             book.mark_borrowed()
-            self.borrowed_books.append(book)
+            self.borrowed_books.add(book)
             print(f"\n✅ {self.name} borrowed '{book.title}'")
         else:
             print(f"\n❌ Sorry, '{book.title}' is already borrowed.")
@@ -50,28 +58,24 @@ class Member:
 
 class Library:
     def __init__(self):
-        self.books = []
-        self.members = []
+        # Dicts keyed by ISBN/member ID so lookups are O(1) hash probes
+        # instead of scanning every book or member on each borrow/return.
+        self.books = {}
+        self.members = {}
 
     def add_book(self, book):
-        self.books.append(book)
+        self.books[book.isbn] = book
         print(f"\n📚 Book '{book.title}' added to the library!")
 
     def add_member(self, member):
-        self.members.append(member)
+        self.members[member.member_id] = member
         print(f"\n👤 Member '{member.name}' added to the system!")
 
     def find_book(self, isbn):
-        for book in self.books:
-            if book.isbn == isbn:
-                return book
-        return None
+        return self.books.get(isbn)
 
     def find_member(self, member_id):
-        for member in self.members:
-            if member.member_id == member_id:
-                return member
-        return None
+        return self.members.get(member_id)
 
     def borrow_book(self, member_id, isbn):
         member = self.find_member(member_id)
@@ -93,18 +97,26 @@ class Library:
         print("\n===== 📚 Library Books =====")
         if not self.books:
             print("No books in the library yet.")
-        for book in self.books:
+        for book in self.books.values():
             print(book)
 
     def display_members(self):
         print("\n===== 👥 Library Members =====")
         if not self.members:
             print("No members in the system yet.")
-        for member in self.members:
+        for member in self.members.values():
             print(member)
 
 
 # -------------------- MAIN PROGRAM --------------------
+def prompt_fields(prompt, count):
+    fields = [part.strip() for part in input(prompt).split(",")]
+    if len(fields) != count or not all(fields):
+        print(f"\n❌ Expected {count} comma-separated values.")
+        return None
+    return fields
+
+
 def main():
     library = Library()
 
@@ -121,26 +133,27 @@ def main():
 
         choice = input("Enter your choice (1-7): ")
 
+        # Each action takes one comma-separated prompt instead of one
+        # input() (stdout flush + read syscall) per field.
         if choice == "1":
-            title = input("Enter book title: ")
-            author = input("Enter author name: ")
-            isbn = input("Enter ISBN: ")
-            library.add_book(Book(title, author, isbn))
+            fields = prompt_fields("Enter title, author, ISBN: ", 3)
+            if fields:
+                library.add_book(Book(*fields))
 
         elif choice == "2":
-            name = input("Enter member name: ")
-            member_id = input("Enter member ID: ")
-            library.add_member(Member(name, member_id))
+            fields = prompt_fields("Enter member name, member ID: ", 2)
+            if fields:
+                library.add_member(Member(*fields))
 
         elif choice == "3":
-            member_id = input("Enter member ID: ")
-            isbn = input("Enter ISBN of the book to borrow: ")
-            library.borrow_book(member_id, isbn)
+            fields = prompt_fields("Enter member ID, ISBN to borrow: ", 2)
+            if fields:
+                library.borrow_book(*fields)
 
         elif choice == "4":
-            member_id = input("Enter member ID: ")
-            isbn = input("Enter ISBN of the book to return: ")
-            library.return_book(member_id, isbn)
+            fields = prompt_fields("Enter member ID, ISBN to return: ", 2)
+            if fields:
+                library.return_book(*fields)
 
         elif choice == "5":
             library.display_books()
@@ -2,12 +2,15 @@ import requests
 
 API_KEY = "db18fd7e7dedc0cdb65dd8f3207e8a17"
 
+# One session for the process: keep-alive reuses the TCP+TLS connection, so
+# repeated lookups skip the handshake instead of reconnecting per call.
+SESSION = requests.Session()
+
 def get_weather(city):
     url = f"https://api.openweathermap.org/data/2.5/weather?q={city}&appid={API_KEY}&units=metric"
 
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=5)
     data = response.json()
-    print(data)
 
     if data["cod"] != 200:
         print("\n❌ City not found! Try again.")
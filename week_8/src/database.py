@@ -1,20 +1,135 @@
+import queue
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 
 
 DB_PATH = Path(__file__).resolve().parent.parent / "inventory.db"
 
+# Small pool of ready connections shared by every repository: reusing a
+# handle skips the file open, WAL -shm/-wal attach, and page-cache rebuild
+# that a fresh connect pays on each call. WAL allows the pooled readers to
+# run concurrently with one writer.
+_POOL_SIZE = 4
+_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=_POOL_SIZE)
 
-def get_connection():
-    conn = sqlite3.connect(DB_PATH)
+
+def _connect():
+    # cached_statements sizes the per-connection LRU of prepared
+    # statements; with the SQL text hoisted to module constants in the
+    # repositories, repeat calls rebind an already-compiled statement
+    # instead of re-parsing it.
+    # isolation_level=None puts the connection in true autocommit: no
+    # implicit BEGIN before DML, so single statements commit themselves
+    # and multi-statement writes mark their own BEGIN IMMEDIATE/COMMIT
+    # boundaries — exactly one fsync per logical operation either way.
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False,
+                           cached_statements=512, isolation_level=None)
     conn.row_factory = sqlite3.Row
+    # WAL turns the per-commit rollback-journal fsync into an append-only
+    # log write, and synchronous=NORMAL fsyncs only at checkpoints — the
+    # biggest throughput knobs for this insert/update-heavy workload. The
+    # rest sizes the page cache (64 MiB), memory-maps reads (256 MiB),
+    # keeps temp structures off disk, and enforces the declared FKs.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA foreign_keys=ON")
+    # Checkpoint the WAL back into the main file every ~1000 pages so the
+    # log cannot grow unbounded between reader-quiet moments
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
     return conn
 
 
+@contextmanager
+def get_connection():
+    """Borrow a pooled connection for the duration of a with-block."""
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _connect()
+    try:
+        yield conn
+    finally:
+        try:
+            _pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+@contextmanager
+def bulk_load_context(conn):
+    """Drop the sales indexes around a large bulk insert.
+
+    Every inserted row otherwise pays a B-tree update per index; beyond a
+    certain batch size it is cheaper to drop them, insert, and rebuild
+    once, then ANALYZE so the planner sees the fresh statistics.
+    """
+    cur = conn.cursor()
+    cur.execute("DROP INDEX IF EXISTS idx_sales_product")
+    cur.execute("DROP INDEX IF EXISTS idx_sales_sold_at")
+    try:
+        yield conn
+    finally:
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_sales_product ON sales(product_id)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_sales_sold_at ON sales(sold_at)")
+        cur.execute("ANALYZE")
+
+
+class BulkWriter:
+    """Batch rows for one INSERT/UPDATE and flush them in a single call.
+
+    executemany parses and plans the SQL once, then loops bind+step in C,
+    and the whole batch lands in one transaction instead of one commit per
+    row. Usage::
+
+        with BulkWriter(conn, "INSERT INTO sales (...) VALUES (?, ?, ?)") as w:
+            for row in rows:
+                w.add(row)
+    """
+
+    def __init__(self, conn, sql):
+        self.conn = conn
+        self.sql = sql
+        self._rows = []
+
+    def add(self, row):
+        self._rows.append(row)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and self._rows:
+            cur = self.conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.executemany(self.sql, self._rows)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+        return False
+
+
 def init_db():
-    conn = get_connection()
+    with get_connection() as conn:
+        _init_schema(conn)
+
+
+def _init_schema(conn):
     cur = conn.cursor()
 
+    # 8 KiB pages shallow the B-trees for these mixed int/text rows. The
+    # new size only takes effect through a VACUUM run outside WAL mode, so
+    # drop to the rollback journal for the rebuild and restore WAL below
+    # before the connection goes back to the pool.
+    cur.execute("PRAGMA journal_mode=DELETE")
+    cur.execute("PRAGMA page_size=8192")
+    cur.execute("VACUUM")
+
     # Products table
     cur.execute(
         """
@@ -43,9 +158,9 @@ def init_db():
         """
     )
 
-    # Sales table
-    cur.execute(
-        """
+    # Sales table. CASCADE matches the stock FK: with foreign_keys=ON, a
+    # plain FK here would make any product that was ever sold undeletable.
+    sales_ddl = """
         CREATE TABLE IF NOT EXISTS sales (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             product_id INTEGER NOT NULL,
@@ -53,13 +168,69 @@ def init_db():
             unit_price REAL NOT NULL,
             total_price REAL NOT NULL,
             sold_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (product_id) REFERENCES products(id)
+            FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE
         );
         """
+    cur.execute(sales_ddl)
+
+    # Databases created before the CASCADE was added carry the old FK in
+    # their DDL, and SQLite cannot alter a constraint in place — rebuild
+    # the table once when the old declaration is detected. FK enforcement
+    # goes off for the rename/copy so the intermediate states don't trip it.
+    existing = cur.execute(
+        "SELECT sql FROM sqlite_master WHERE type='table' AND name='sales'"
+    ).fetchone()
+    if existing and "ON DELETE CASCADE" not in existing["sql"]:
+        cur.execute("PRAGMA foreign_keys=OFF")
+        cur.execute("BEGIN")
+        try:
+            cur.execute("ALTER TABLE sales RENAME TO sales_old")
+            cur.execute(sales_ddl)
+            cur.execute("INSERT INTO sales SELECT * FROM sales_old")
+            cur.execute("DROP TABLE sales_old")
+            cur.execute("COMMIT")
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+        cur.execute("PRAGMA foreign_keys=ON")
+
+    # Indexes so product lookups and time-range queries seek the B-tree
+    # instead of scanning the whole table. stock is UNIQUE per product —
+    # one row each — which also keeps the LEFT JOIN in listings 1:1.
+    cur.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_stock_product ON stock(product_id);"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sales_product ON sales(product_id);"
     )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sales_sold_at ON sales(sold_at);"
+    )
+    # Covering index for the 1:1 LEFT JOIN in the listing queries: the
+    # join key and the only stock column they read live in the index, so
+    # SQLite never touches the stock table rows themselves. The UNIQUE
+    # single-column index above stays for the one-row-per-product
+    # invariant.
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_stock_cover ON stock(product_id, quantity);"
+    )
+    # Range scans for the low-stock report (WHERE quantity <= ?)
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_stock_quantity ON stock(quantity);"
+    )
+    # list_products orders by name on every refresh; with this index it is
+    # an index walk instead of a sort. (sku already has the implicit
+    # UNIQUE index from its column constraint.)
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_products_name ON products(name);"
+    )
+
+    # Refresh planner statistics so the indexes above actually get picked
+    cur.execute("ANALYZE")
 
-    conn.commit()
-    conn.close()
+    # Back onto WAL after the page-size VACUUM above so the pooled handle
+    # is returned in the mode every other borrower expects.
+    cur.execute("PRAGMA journal_mode=WAL")
 
 
 if __name__ == "__main__":
@@ -1,31 +1,114 @@
-from typing import List, Optional, Dict, Any
+import sqlite3
+from collections import Counter
+from contextlib import nullcontext
+from typing import List, Optional, Sequence, Tuple
 
-from .database import get_connection
+from .database import bulk_load_context, get_connection
+
+
+# SQL hoisted to module constants: stable text identity guarantees hits in
+# the connection's prepared-statement cache, so each statement is parsed
+# and planned once per connection instead of once per call.
+_SQL_INSERT_PRODUCT = """
+    INSERT INTO products (sku, name, category, cost_price, selling_price)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_STOCK = "INSERT INTO stock (product_id, quantity) VALUES (?, 0)"
+
+_SQL_UPDATE_PRODUCT = """
+    UPDATE products
+    SET sku = ?, name = ?, category = ?, cost_price = ?, selling_price = ?
+    WHERE id = ?
+"""
+
+_SQL_DELETE_PRODUCT = "DELETE FROM products WHERE id = ?"
+
+_SQL_LIST_PRODUCTS = """
+    SELECT p.id, p.sku, p.name, p.category, p.cost_price, p.selling_price,
+           IFNULL(s.quantity, 0) as quantity
+    FROM products p
+    LEFT JOIN stock s ON p.id = s.product_id
+    ORDER BY p.name
+"""
+
+_SQL_GET_PRODUCT = """
+    SELECT p.id, p.sku, p.name, p.category, p.cost_price, p.selling_price,
+           IFNULL(s.quantity, 0) as quantity
+    FROM products p
+    LEFT JOIN stock s ON p.id = s.product_id
+    WHERE p.id = ?
+"""
+
+_SQL_LIST_PRODUCTS_MINIMAL = """
+    SELECT p.id, p.name, IFNULL(s.quantity, 0) as quantity
+    FROM products p
+    LEFT JOIN stock s ON p.id = s.product_id
+    ORDER BY p.name
+"""
+
+_SQL_LIST_LOW_STOCK = """
+    SELECT p.sku, p.name, IFNULL(s.quantity, 0) as quantity
+    FROM products p
+    LEFT JOIN stock s ON p.id = s.product_id
+    WHERE IFNULL(s.quantity, 0) <= ?
+    ORDER BY quantity ASC
+"""
+
+_SQL_ADJUST_STOCK = """
+    UPDATE stock
+    SET quantity = quantity + ?, last_updated = CURRENT_TIMESTAMP
+    WHERE product_id = ?
+"""
+
+_SQL_SET_STOCK = """
+    UPDATE stock
+    SET quantity = ?, last_updated = CURRENT_TIMESTAMP
+    WHERE product_id = ?
+"""
+
+_SQL_INSERT_SALE = """
+    INSERT INTO sales (product_id, quantity, unit_price, total_price)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_DEDUCT_STOCK = """
+    UPDATE stock
+    SET quantity = quantity - ?, last_updated = CURRENT_TIMESTAMP
+    WHERE product_id = ?
+"""
+
+_SQL_SALES_SUMMARY = """
+    SELECT s.id, p.sku, p.name, s.quantity, s.unit_price, s.total_price, s.sold_at
+    FROM sales s
+    JOIN products p ON s.product_id = p.id
+    ORDER BY s.sold_at DESC
+    LIMIT ? OFFSET ?
+"""
 
 
 class ProductRepository:
     @staticmethod
     def create_product(sku: str, name: str, category: str, cost_price: float, selling_price: float) -> int:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO products (sku, name, category, cost_price, selling_price)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (sku, name, category, cost_price, selling_price),
-        )
-        product_id = cur.lastrowid
-
-        # Initialize stock
-        cur.execute(
-            "INSERT INTO stock (product_id, quantity) VALUES (?, 0)",
-            (product_id,),
-        )
-
-        conn.commit()
-        conn.close()
-        return product_id
+        with get_connection() as conn:
+            cur = conn.cursor()
+            # One transaction, one fsync, for the product + stock pair;
+            # IMMEDIATE takes the write lock up front so the pair cannot
+            # deadlock against another writer mid-way.
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute(_SQL_INSERT_PRODUCT, (sku, name, category, cost_price, selling_price))
+                product_id = cur.lastrowid
+
+                # Initialize stock
+                cur.execute(_SQL_INSERT_STOCK, (product_id,))
+
+                cur.execute("COMMIT")
+            except Exception:
+                # Never hand a connection back to the pool mid-transaction
+                cur.execute("ROLLBACK")
+                raise
+            return product_id
 
     @staticmethod
     def update_product(
@@ -36,140 +119,160 @@ class ProductRepository:
         cost_price: float,
         selling_price: float,
     ) -> None:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            UPDATE products
-            SET sku = ?, name = ?, category = ?, cost_price = ?, selling_price = ?
-            WHERE id = ?
-            """,
-            (sku, name, category, cost_price, selling_price, product_id),
-        )
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            conn.execute(_SQL_UPDATE_PRODUCT, (sku, name, category, cost_price, selling_price, product_id))
 
     @staticmethod
     def delete_product(product_id: int) -> None:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM products WHERE id = ?", (product_id,))
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            conn.execute(_SQL_DELETE_PRODUCT, (product_id,))
+
+    @staticmethod
+    def delete_products(product_ids: Sequence[int]) -> None:
+        # executemany binds the compiled DELETE once per batch, and the
+        # explicit transaction means one fsync no matter how many rows go
+        if not product_ids:
+            return
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.executemany(_SQL_DELETE_PRODUCT, [(pid,) for pid in product_ids])
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def list_products() -> List[sqlite3.Row]:
+        with get_connection() as conn:
+            # Hand back the Row objects sqlite3 already built: name-indexable
+            # like the dicts they replace, without N dict constructions
+            return conn.execute(_SQL_LIST_PRODUCTS).fetchall()
+
+    @staticmethod
+    def list_products_minimal() -> List[sqlite3.Row]:
+        # id/name/quantity projection for pickers and dropdowns: skips the
+        # text and float columns they never display, so less crosses the
+        # sqlite3 bridge when a caller doesn't need the full catalog rows
+        with get_connection() as conn:
+            return conn.execute(_SQL_LIST_PRODUCTS_MINIMAL).fetchall()
 
     @staticmethod
-    def list_products() -> List[Dict[str, Any]]:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT p.id, p.sku, p.name, p.category, p.cost_price, p.selling_price,
-                   IFNULL(s.quantity, 0) as quantity
-            FROM products p
-            LEFT JOIN stock s ON p.id = s.product_id
-            ORDER BY p.name
-            """
-        )
-        rows = [dict(row) for row in cur.fetchall()]
-        conn.close()
-        return rows
+    def list_low_stock(threshold: int) -> List[sqlite3.Row]:
+        # Filter and project in SQL: only the rows under the threshold and
+        # the three columns the report shows cross the sqlite3 bridge,
+        # instead of the whole catalog being materialized and filtered in
+        # Python.
+        with get_connection() as conn:
+            return conn.execute(_SQL_LIST_LOW_STOCK, (threshold,)).fetchall()
 
     @staticmethod
-    def get_product(product_id: int) -> Optional[Dict[str, Any]]:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT p.id, p.sku, p.name, p.category, p.cost_price, p.selling_price,
-                   IFNULL(s.quantity, 0) as quantity
-            FROM products p
-            LEFT JOIN stock s ON p.id = s.product_id
-            WHERE p.id = ?
-            """,
-            (product_id,),
-        )
-        row = cur.fetchone()
-        conn.close()
-        return dict(row) if row else None
+    def get_product(product_id: int) -> Optional[sqlite3.Row]:
+        with get_connection() as conn:
+            return conn.execute(_SQL_GET_PRODUCT, (product_id,)).fetchone()
 
 
 class StockRepository:
     @staticmethod
     def adjust_stock(product_id: int, delta: int) -> None:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            UPDATE stock
-            SET quantity = quantity + ?, last_updated = CURRENT_TIMESTAMP
-            WHERE product_id = ?
-            """,
-            (delta, product_id),
-        )
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            conn.execute(_SQL_ADJUST_STOCK, (delta, product_id))
+
+    @staticmethod
+    def adjust_stocks(deltas: Sequence[Tuple[int, int]]) -> None:
+        """Apply many (product_id, delta) adjustments in one transaction."""
+        if not deltas:
+            return
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.executemany(_SQL_ADJUST_STOCK, [(delta, pid) for pid, delta in deltas])
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
 
     @staticmethod
     def set_stock(product_id: int, quantity: int) -> None:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            UPDATE stock
-            SET quantity = ?, last_updated = CURRENT_TIMESTAMP
-            WHERE product_id = ?
-            """,
-            (quantity, product_id),
-        )
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            conn.execute(_SQL_SET_STOCK, (quantity, product_id))
 
 
 class SalesRepository:
     @staticmethod
     def record_sale(product_id: int, quantity: int, unit_price: float) -> int:
         total_price = quantity * unit_price
-        conn = get_connection()
-        cur = conn.cursor()
-
-        # Record sale
-        cur.execute(
-            """
-            INSERT INTO sales (product_id, quantity, unit_price, total_price)
-            VALUES (?, ?, ?, ?)
-            """,
-            (product_id, quantity, unit_price, total_price),
-        )
-
-        # Deduct stock
-        cur.execute(
-            """
-            UPDATE stock
-            SET quantity = quantity - ?, last_updated = CURRENT_TIMESTAMP
-            WHERE product_id = ?
-            """,
-            (quantity, product_id),
-        )
-
-        sale_id = cur.lastrowid
-        conn.commit()
-        conn.close()
-        return sale_id
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                # Record sale
+                cur.execute(_SQL_INSERT_SALE, (product_id, quantity, unit_price, total_price))
+                sale_id = cur.lastrowid
+
+                # Deduct stock
+                cur.execute(_SQL_DEDUCT_STOCK, (quantity, product_id))
+
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+            return sale_id
+
+    # Rows per multi-VALUES INSERT: 4 parameters each keeps a batch well
+    # under SQLite's historical 999-variable limit
+    _BULK_CHUNK = 200
+    # Above this many rows, dropping and rebuilding the sales indexes
+    # beats maintaining them per insert
+    _BULK_REINDEX_THRESHOLD = 5000
 
     @staticmethod
-    def sales_summary() -> List[Dict[str, Any]]:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT s.id, p.sku, p.name, s.quantity, s.unit_price, s.total_price, s.sold_at
-            FROM sales s
-            JOIN products p ON s.product_id = p.id
-            ORDER BY s.sold_at DESC
-            """
-        )
-        rows = [dict(row) for row in cur.fetchall()]
-        conn.close()
-        return rows
+    def record_sales_bulk(entries: Sequence[Tuple[int, int, float]]) -> None:
+        """Record many (product_id, quantity, unit_price) sales at once.
+
+        All rows go through multi-row VALUES inserts and the stock deltas
+        are netted per product into one UPDATE each, inside a single
+        transaction — one parse/bind pass and one fsync for the whole
+        batch instead of one of each per sale.
+        """
+        if not entries:
+            return
+        params: List[float] = []
+        deltas: Counter = Counter()
+        for product_id, quantity, unit_price in entries:
+            params.extend((product_id, quantity, unit_price, quantity * unit_price))
+            deltas[product_id] += quantity
 
+        with get_connection() as conn:
+            cur = conn.cursor()
+            maintenance = (
+                bulk_load_context(conn)
+                if len(entries) >= SalesRepository._BULK_REINDEX_THRESHOLD
+                else nullcontext()
+            )
+            with maintenance:
+                cur.execute("BEGIN IMMEDIATE")
+                try:
+                    step = SalesRepository._BULK_CHUNK * 4
+                    for start in range(0, len(params), step):
+                        chunk = params[start:start + step]
+                        cur.execute(
+                            "INSERT INTO sales (product_id, quantity, unit_price, total_price) VALUES "
+                            + ", ".join(["(?, ?, ?, ?)"] * (len(chunk) // 4)),
+                            chunk,
+                        )
+                    cur.executemany(_SQL_DEDUCT_STOCK, [(qty, pid) for pid, qty in deltas.items()])
+                    cur.execute("COMMIT")
+                except Exception:
+                    cur.execute("ROLLBACK")
+                    raise
 
+    @staticmethod
+    def sales_summary(limit: int = 200, offset: int = 0) -> List[sqlite3.Row]:
+        # Page through the history newest-first: with the sold_at index
+        # this is a bounded index range scan, so fetch cost tracks the
+        # page size rather than the total number of sales ever recorded.
+        with get_connection() as conn:
+            return conn.execute(_SQL_SALES_SUMMARY, (limit, offset)).fetchall()
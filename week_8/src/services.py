@@ -1,11 +1,39 @@
-from typing import List, Dict, Any
+import sqlite3
+from typing import List, Optional, Sequence, Tuple
 
 from .repository import ProductRepository, StockRepository, SalesRepository
 
 
 class InventoryService:
-    def list_products(self) -> List[Dict[str, Any]]:
-        return ProductRepository.list_products()
+    # Generation counter bumped by every write that can change what
+    # list_products returns. Class-level so all service instances —
+    # including the reporting service's — agree on the current generation.
+    _version = 0
+
+    def __init__(self) -> None:
+        self._products_cache: List[sqlite3.Row] = []
+        self._cache_version = -1
+
+    @classmethod
+    def bump_version(cls) -> None:
+        cls._version += 1
+
+    def list_products(self) -> List[sqlite3.Row]:
+        # Serve the memoized list while no write has happened since the
+        # last fetch; the UI calls this from several refresh paths per
+        # action, and only the first one should hit SQLite.
+        if self._cache_version != InventoryService._version:
+            self._products_cache = ProductRepository.list_products()
+            self._cache_version = InventoryService._version
+        return self._products_cache
+
+    def list_products_minimal(self) -> List[sqlite3.Row]:
+        """id/name/quantity only — for pickers that skip the full row.
+
+        Callers that also render the full list in the same refresh should
+        prefer list_products: one cached SELECT serves both views.
+        """
+        return ProductRepository.list_products_minimal()
 
     def create_product(
         self,
@@ -19,6 +47,7 @@ class InventoryService:
         product_id = ProductRepository.create_product(sku, name, category, cost_price, selling_price)
         if initial_stock:
             StockRepository.set_stock(product_id, initial_stock)
+        InventoryService.bump_version()
 
     def update_product(
         self,
@@ -30,28 +59,55 @@ class InventoryService:
         selling_price: float,
     ) -> None:
         ProductRepository.update_product(product_id, sku, name, category, cost_price, selling_price)
+        InventoryService.bump_version()
 
     def delete_product(self, product_id: int) -> None:
         ProductRepository.delete_product(product_id)
+        InventoryService.bump_version()
+
+    def delete_products(self, product_ids: Sequence[int]) -> None:
+        ProductRepository.delete_products(product_ids)
+        InventoryService.bump_version()
 
     def adjust_stock(self, product_id: int, delta: int) -> None:
         StockRepository.adjust_stock(product_id, delta)
+        InventoryService.bump_version()
+
+    def adjust_stocks(self, deltas: Sequence[Tuple[int, int]]) -> None:
+        StockRepository.adjust_stocks(deltas)
+        InventoryService.bump_version()
 
 
 class SalesService:
     def record_sale(self, product_id: int, quantity: int, unit_price: float) -> None:
         SalesRepository.record_sale(product_id, quantity, unit_price)
+        # The sale deducted stock, so cached product lists are stale
+        InventoryService.bump_version()
 
-    def sales_history(self) -> List[Dict[str, Any]]:
-        return SalesRepository.sales_summary()
+    def record_sales_bulk(self, entries: Sequence[Tuple[int, int, float]]) -> None:
+        """Bulk entry point for future CSV/import flows."""
+        SalesRepository.record_sales_bulk(entries)
+        InventoryService.bump_version()
+
+    def sales_history(self, limit: int = 200, offset: int = 0) -> List[sqlite3.Row]:
+        return SalesRepository.sales_summary(limit, offset)
 
 
 class ReportingService:
-    def inventory_report(self) -> List[Dict[str, Any]]:
-        return ProductRepository.list_products()
+    def __init__(self, inventory: Optional[InventoryService] = None) -> None:
+        # Share the app's inventory service so reports reuse its cache
+        self._inventory = inventory or InventoryService()
+
+    def inventory_report(self) -> List[sqlite3.Row]:
+        return self._inventory.list_products()
 
-    def low_stock_report(self, threshold: int = 5) -> List[Dict[str, Any]]:
-        products = ProductRepository.list_products()
-        return [p for p in products if p.get("quantity", 0) <= threshold]
+    def low_stock_report(self, threshold: int = 5) -> List[sqlite3.Row]:
+        return ProductRepository.list_low_stock(threshold)
 
 
+# Process-wide instances: the services carry no per-consumer state beyond
+# the shared product cache, so everything in the app can use these instead
+# of constructing its own copies.
+inventory_service = InventoryService()
+sales_service = SalesService()
+reporting_service = ReportingService(inventory_service)
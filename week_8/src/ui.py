@@ -1,9 +1,10 @@
+import concurrent.futures
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional
 
 from .database import init_db
-from .services import InventoryService, SalesService, ReportingService
+from .services import InventoryService, inventory_service, reporting_service, sales_service
 
 
 class InventoryApp(tk.Tk):
@@ -15,14 +16,34 @@ class InventoryApp(tk.Tk):
 
         # Services
         init_db()
-        self.inventory_service = InventoryService()
-        self.sales_service = SalesService()
-        self.reporting_service = ReportingService()
+        # Process-wide singletons; the reporting service already shares
+        # the inventory service's product cache
+        self.inventory_service = inventory_service
+        self.sales_service = sales_service
+        self.reporting_service = reporting_service
+
+        # All SQLite work runs on this single worker so writes serialize
+        # and the Tk main thread never blocks on an fsync; results come
+        # back via after() so widget access stays on the main thread.
+        self._db_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        # Data generation each section last loaded, against the inventory
+        # version counter: section switches skip the reload when nothing
+        # has been written since.
+        self._last_refresh_version = {"products": -1, "sales": -1, "reports": -1}
+        self._pending_refresh: Optional[str] = None
+        # Formatted combobox entries, keyed by the inventory version they
+        # were built from
+        self._combo_cache: tuple = (-1, [])
 
         self._configure_style()
         self._build_layout()
-        self._load_products()
-        self._load_sales()
+        # First paint is layout-only: _build_layout's _show_section already
+        # queued the product load on the worker; the sales fill waits for
+        # idle and a prewarm drags the low-stock query through SQLite so
+        # its pages are cached before the user opens Reports.
+        self.after_idle(self._load_sales)
+        self.after(50, self._prewarm_reports)
 
     def _configure_style(self) -> None:
         style = ttk.Style(self)
@@ -77,6 +98,29 @@ class InventoryApp(tk.Tk):
         self._build_reports_section(self.frames["reports"])
         self._show_section("products")
 
+    def _run_db(self, fn, on_done) -> None:
+        """Run fn on the DB worker; call on_done(future) on the Tk thread."""
+        fut = self._db_executor.submit(fn)
+        fut.add_done_callback(lambda f: self.after(0, on_done, f))
+
+    def _schedule_refresh(self) -> None:
+        # Coalesce bursts of writes into one reload pass: each new write
+        # within 50 ms resets the timer instead of stacking another
+        # products+sales refresh.
+        if self._pending_refresh is not None:
+            self.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.after(50, self._refresh_all)
+
+    def _prewarm_reports(self) -> None:
+        # Fire-and-forget on the worker: the result is discarded, the point
+        # is the page-cache warmth for the first real reports refresh
+        self._db_executor.submit(self.reporting_service.low_stock_report)
+
+    def _refresh_all(self) -> None:
+        self._pending_refresh = None
+        self._load_products()
+        self._load_sales()
+
     # ---------- Products Section ----------
     def _build_products_section(self, container: ttk.Frame) -> None:
         container.columnconfigure(0, weight=2)
@@ -124,12 +168,23 @@ class InventoryApp(tk.Tk):
         ttk.Button(btn_frame, text="Delete", command=self._delete_product).pack(side=tk.LEFT, padx=3)
 
     def _load_products(self) -> None:
-        for item in self.product_tree.get_children():
-            self.product_tree.delete(item)
-        for p in self.inventory_service.list_products():
-            self.product_tree.insert(
-                "", tk.END, values=(p["id"], p["sku"], p["name"], p["category"], p["cost_price"], p["selling_price"], p["quantity"])
-            )
+        self._last_refresh_version["products"] = InventoryService._version
+        self._run_db(self.inventory_service.list_products, self._apply_products)
+
+    def _apply_products(self, fut) -> None:
+        try:
+            rows = fut.result()
+        except Exception as exc:  # noqa: BLE001
+            messagebox.showerror("Error", str(exc))
+            return
+        # One Tcl round-trip clears the whole tree instead of one per row
+        self.product_tree.delete(*self.product_tree.get_children())
+        # Rows come back in the tree's column order, so each one passes
+        # straight through without per-field dict lookups; binding the
+        # bound method and sentinel as locals keeps the loop on LOAD_FAST
+        insert, end = self.product_tree.insert, tk.END
+        for p in rows:
+            insert("", end, values=tuple(p))
 
     def _on_product_select(self, event) -> None:
         selected = self.product_tree.selection()
@@ -170,22 +225,27 @@ class InventoryApp(tk.Tk):
             messagebox.showerror("Missing Data", "SKU and Name are required.")
             return
 
+        if self.selected_product_id:
+            product_id = self.selected_product_id
+            job = lambda: self.inventory_service.update_product(  # noqa: E731
+                product_id, sku, name, category, cost_price, selling_price
+            )
+        else:
+            job = lambda: self.inventory_service.create_product(  # noqa: E731
+                sku, name, category, cost_price, selling_price, initial_stock
+            )
+        self._run_db(job, self._on_product_saved)
+
+    def _on_product_saved(self, fut) -> None:
         try:
-            if self.selected_product_id:
-                self.inventory_service.update_product(
-                    self.selected_product_id, sku, name, category, cost_price, selling_price
-                )
-            else:
-                self.inventory_service.create_product(
-                    sku, name, category, cost_price, selling_price, initial_stock
-                )
-            self._load_products()
-            # Also refresh sales section combobox so new products can be selected for sales
-            self._load_sales()
-            self._clear_product_form()
-            messagebox.showinfo("Success", "Product saved successfully.")
+            fut.result()
         except Exception as exc:  # noqa: BLE001
             messagebox.showerror("Error", str(exc))
+            return
+        # One coalesced refresh covers the product tree and sales combobox
+        self._schedule_refresh()
+        self._clear_product_form()
+        messagebox.showinfo("Success", "Product saved successfully.")
 
     def _delete_product(self) -> None:
         if not self.selected_product_id:
@@ -193,12 +253,17 @@ class InventoryApp(tk.Tk):
             return
         if not messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this product?"):
             return
+        product_id = self.selected_product_id
+        self._run_db(lambda: self.inventory_service.delete_product(product_id), self._on_product_deleted)
+
+    def _on_product_deleted(self, fut) -> None:
         try:
-            self.inventory_service.delete_product(self.selected_product_id)
-            self._load_products()
-            self._clear_product_form()
+            fut.result()
         except Exception as exc:  # noqa: BLE001
             messagebox.showerror("Error", str(exc))
+            return
+        self._schedule_refresh()
+        self._clear_product_form()
 
     # ---------- Sales Section ----------
     def _build_sales_section(self, container: ttk.Frame) -> None:
@@ -219,6 +284,12 @@ class InventoryApp(tk.Tk):
             self.sales_tree.column(col, width=90, anchor="center")
         self.sales_tree.pack(fill=tk.BOTH, expand=True)
 
+        # Paged history: the tree shows one page at a time so a refresh
+        # costs O(page) inserts no matter how many sales exist
+        self._sales_page_size = 200
+        self._sales_offset = 0
+        ttk.Button(sales_card, text="Load More", command=self._load_more_sales).pack(pady=5, anchor="e")
+
         # New sale form
         form_card = ttk.Frame(container, style="Card.TFrame", padding=10)
         form_card.grid(row=0, column=1, sticky="nsew")
@@ -245,20 +316,60 @@ class InventoryApp(tk.Tk):
         )
 
     def _load_sales(self) -> None:
-        for item in self.sales_tree.get_children():
-            self.sales_tree.delete(item)
-        for s in self.sales_service.sales_history():
-            self.sales_tree.insert(
-                "", tk.END, values=(s["id"], s["sku"], s["name"], s["quantity"], s["unit_price"], s["total_price"], s["sold_at"])
+        self._last_refresh_version["sales"] = InventoryService._version
+
+        def fetch():
+            return (
+                self.sales_service.sales_history(limit=self._sales_page_size),
+                self.inventory_service.list_products(),
             )
 
-        # Refresh product list for combo
-        products = self.inventory_service.list_products()
-        display = [f'{p["id"]} - {p["name"]} (Stock: {p["quantity"]})' for p in products]
+        self._run_db(fetch, self._apply_sales)
+
+    def _apply_sales(self, fut) -> None:
+        try:
+            sales, products = fut.result()
+        except Exception as exc:  # noqa: BLE001
+            messagebox.showerror("Error", str(exc))
+            return
+        self.sales_tree.delete(*self.sales_tree.get_children())
+        insert, end = self.sales_tree.insert, tk.END
+        for s in sales:
+            insert("", end, values=tuple(s))
+        self._sales_offset = len(sales)
+
+        # Refresh product list for combo, rebuilding the N formatted
+        # entries only when the products actually changed since they were
+        # last built; the version was stamped when this load was submitted
+        version = self._last_refresh_version["sales"]
+        if self._combo_cache[0] != version:
+            self._combo_cache = (
+                version,
+                [f'{p["id"]} - {p["name"]} (Stock: {p["quantity"]})' for p in products],
+            )
+        display = self._combo_cache[1]
         self.sale_product_combo["values"] = display
         if display:
             self.sale_product_combo.current(0)
 
+    def _load_more_sales(self) -> None:
+        offset = self._sales_offset
+        self._run_db(
+            lambda: self.sales_service.sales_history(limit=self._sales_page_size, offset=offset),
+            self._apply_more_sales,
+        )
+
+    def _apply_more_sales(self, fut) -> None:
+        try:
+            sales = fut.result()
+        except Exception as exc:  # noqa: BLE001
+            messagebox.showerror("Error", str(exc))
+            return
+        insert, end = self.sales_tree.insert, tk.END
+        for s in sales:
+            insert("", end, values=tuple(s))
+        self._sales_offset += len(sales)
+
     def _record_sale(self) -> None:
         product_text = self.sale_product_var.get()
         if not product_text:
@@ -272,15 +383,21 @@ class InventoryApp(tk.Tk):
             messagebox.showerror("Invalid Input", "Please check quantity and unit price.")
             return
 
+        self._run_db(
+            lambda: self.sales_service.record_sale(product_id, quantity, unit_price),
+            self._on_sale_recorded,
+        )
+
+    def _on_sale_recorded(self, fut) -> None:
         try:
-            self.sales_service.record_sale(product_id, quantity, unit_price)
-            self._load_sales()
-            self._load_products()
-            self.sale_qty_entry.delete(0, tk.END)
-            self.sale_price_entry.delete(0, tk.END)
-            messagebox.showinfo("Success", "Sale recorded successfully.")
+            fut.result()
         except Exception as exc:  # noqa: BLE001
             messagebox.showerror("Error", str(exc))
+            return
+        self._schedule_refresh()
+        self.sale_qty_entry.delete(0, tk.END)
+        self.sale_price_entry.delete(0, tk.END)
+        messagebox.showinfo("Success", "Sale recorded successfully.")
 
     # ---------- Reports Section ----------
     def _build_reports_section(self, container: ttk.Frame) -> None:
@@ -330,34 +447,48 @@ class InventoryApp(tk.Tk):
         self._refresh_reports()
 
     def _refresh_reports(self) -> None:
-        for item in self.report_inv_tree.get_children():
-            self.report_inv_tree.delete(item)
-        for p in self.reporting_service.inventory_report():
-            self.report_inv_tree.insert(
-                "", tk.END, values=(p["sku"], p["name"], p["category"], p["selling_price"], p["quantity"])
-            )
-
-        for item in self.report_low_tree.get_children():
-            self.report_low_tree.delete(item)
-
+        self._last_refresh_version["reports"] = InventoryService._version
         try:
             threshold = int(self.low_threshold_var.get())
         except ValueError:
             threshold = 5
 
-        for p in self.reporting_service.low_stock_report(threshold):
-            self.report_low_tree.insert("", tk.END, values=(p["sku"], p["name"], p["quantity"]))
+        def fetch():
+            return (
+                self.reporting_service.inventory_report(),
+                self.reporting_service.low_stock_report(threshold),
+            )
+
+        self._run_db(fetch, self._apply_reports)
+
+    def _apply_reports(self, fut) -> None:
+        try:
+            inventory, low_stock = fut.result()
+        except Exception as exc:  # noqa: BLE001
+            messagebox.showerror("Error", str(exc))
+            return
+        self.report_inv_tree.delete(*self.report_inv_tree.get_children())
+        insert, end = self.report_inv_tree.insert, tk.END
+        for p in inventory:
+            insert("", end, values=(p["sku"], p["name"], p["category"], p["selling_price"], p["quantity"]))
+
+        self.report_low_tree.delete(*self.report_low_tree.get_children())
+        insert = self.report_low_tree.insert
+        for p in low_stock:
+            insert("", end, values=tuple(p))
 
     # ---------- Navigation ----------
     def _show_section(self, name: str) -> None:
         self.section_var.set(name)
-        # Refresh data when switching sections to keep UI in sync
-        if name == "products":
-            self._load_products()
-        elif name == "sales":
-            self._load_sales()
-        elif name == "reports":
-            self._refresh_reports()
+        # Refresh the target section only if something was written since
+        # it last loaded; plain navigation costs no SELECTs.
+        if self._last_refresh_version[name] != InventoryService._version:
+            if name == "products":
+                self._load_products()
+            elif name == "sales":
+                self._load_sales()
+            elif name == "reports":
+                self._refresh_reports()
 
         for key, frame in self.frames.items():
             if key == name: